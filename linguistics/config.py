@@ -37,6 +37,11 @@ class LinguisticsConfig:
     MEMORY_DIR: Path = DATA_DIR / "memory"
     TRANSCRIPTS_DIR: Path = DATA_DIR / "transcripts"
     
+    # Memory Configuration
+    MEMORY_HOT_SESSIONS: int = int(
+        os.getenv("MEMORY_HOT_SESSIONS", "128")
+    )
+    
     # RAG Configuration
     EMBEDDING_DIMENSION: int = int(
         os.getenv("EMBEDDING_DIMENSION", "768")
@@ -6,6 +6,7 @@ with API key validation, retry/backoff logic, and graceful degradation.
 """
 
 import logging
+import threading
 import time
 from typing import List, Optional
 
@@ -190,17 +191,24 @@ class EmbeddingService:
 
 # Global embedding service instance
 _embedding_service: Optional[EmbeddingService] = None
+_embedding_service_lock = threading.Lock()
 
 
 def get_embedding_service() -> EmbeddingService:
     """Get or create the global embedding service instance."""
     global _embedding_service
-    if _embedding_service is None:
-        _embedding_service = EmbeddingService()
-    return _embedding_service
+    service = _embedding_service
+    if service is None:
+        # Double-checked so concurrent first calls build a single instance
+        with _embedding_service_lock:
+            if _embedding_service is None:
+                _embedding_service = EmbeddingService()
+            service = _embedding_service
+    return service
 
 
 def reset_embedding_service() -> None:
     """Reset the global embedding service instance (useful for testing)."""
     global _embedding_service
-    _embedding_service = None
+    with _embedding_service_lock:
+        _embedding_service = None
@@ -3,28 +3,371 @@ Memory service for linguistics package.
 
 Provides memory management capabilities for storing, retrieving,
 and managing conversation history and contextual information.
+
+Conversations live in a two-tier store: recently active sessions are kept
+in an in-process LRU (the hot tier), and when a ``storage_path`` is given
+every session is also persisted to SQLite (the cold tier). Sessions evicted
+from the hot tier are flushed to disk and transparently reloaded on access.
+
+Writes to the cold tier are buffered and flushed by a background task
+(write-behind); all database work runs in a worker thread so it never
+blocks the event loop.
 """
 
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import asyncio
+import heapq
+import json
 import logging
+import sqlite3
+import threading
+
+from ..config import config
+
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
 
 
 logger = logging.getLogger(__name__)
 
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    conversation_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    role TEXT,
+    content TEXT,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (conversation_id, seq)
+);
+CREATE TABLE IF NOT EXISTS contexts (
+    conversation_id TEXT PRIMARY KEY,
+    payload BLOB NOT NULL
+);
+"""
+
+_INSERT_MESSAGE = (
+    "INSERT OR REPLACE INTO messages "
+    "(conversation_id, seq, role, content, payload) VALUES (?, ?, ?, ?, ?)"
+)
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a payload for the cold tier (orjson when available)."""
+    if _orjson_available:
+        return orjson.dumps(
+            value,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(value, default=str).encode("utf-8")
+
+
+def _text_column(value: Any) -> Optional[str]:
+    """Value for an indexed text column; non-string values live only in the payload."""
+    return value if isinstance(value, str) else None
+
+
+def _loads(payload: Any) -> Any:
+    """Deserialize a cold-tier payload written by either serializer."""
+    if _orjson_available:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _match_score(content: Any, query_lower: str) -> int:
+    """Count occurrences of a lowercased query in message content."""
+    if not isinstance(content, str):
+        return 0
+    if not query_lower:
+        return 1
+    # Plain lower() on purpose: it is the fastest lowercasing for ASCII text
+    return content.lower().count(query_lower)
+
+
 class MemoryService:
     """Service for managing conversation memory and context."""
     
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        hot_sessions: Optional[int] = None,
+        flush_batch_size: int = 32,
+        flush_interval: float = 1.0,
+    ):
         """
         Initialize the memory service.
         
         Args:
-            storage_path: Optional path for persistent storage
+            storage_path: Optional path for persistent storage (SQLite file or directory)
+            hot_sessions: Maximum number of conversations kept in memory when
+                persistent storage is enabled (defaults to config.MEMORY_HOT_SESSIONS)
+            flush_batch_size: Number of buffered messages that triggers an early flush
+            flush_interval: Seconds between background flushes of buffered writes
         """
         self.storage_path = storage_path
-        self.conversations: Dict[str, Dict[str, Any]] = {}
+        self.hot_sessions = max(1, hot_sessions or config.MEMORY_HOT_SESSIONS)
+        self.flush_batch_size = max(1, flush_batch_size)
+        self.flush_interval = flush_interval
+        
+        # Hot tier, ordered from least to most recently used
+        self.conversations: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
+        # Write buffers for the cold tier
+        self._pending_messages: List[Tuple[str, int, Optional[str], Optional[str], bytes]] = []
+        self._dirty_contexts: set = set()
+        self._next_seq: Dict[str, int] = {}
+        
+        # Database access is serialized; the work itself runs in a thread.
+        # The thread lock also covers work that outlives a cancelled caller.
+        self._db_lock = threading.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # (loop, I/O lock, flush wakeup event), created inside the running loop
+        self._loop_primitives: Optional[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Lock, asyncio.Event]
+        ] = None
+        
+        self._db: Optional[sqlite3.Connection] = None
+        if storage_path:
+            self._db = self._open_database(Path(storage_path))
+    
+    @staticmethod
+    def _open_database(path: Path) -> sqlite3.Connection:
+        """Open (and initialize) the SQLite cold tier."""
+        if path.is_dir():
+            path = path / "memory.sqlite3"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Used from worker threads, one at a time (guarded by _db_lock)
+        db = sqlite3.connect(str(path), check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(_SCHEMA)
+        return db
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Return the cold-tier connection (callers check that it is open)."""
+        assert self._db is not None, "persistent storage is not enabled"
+        return self._db
+    
+    def _primitives(self) -> Tuple[asyncio.Lock, asyncio.Event]:
+        """
+        Return the I/O lock and flush wakeup event for the running loop.
+        
+        They are created on first use: before Python 3.10 asyncio primitives
+        bind to the loop current at construction, which is not the loop
+        asyncio.run later drives the service with.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop_primitives is None or self._loop_primitives[0] is not loop:
+            self._loop_primitives = (loop, asyncio.Lock(), asyncio.Event())
+        _, io_lock, flush_wakeup = self._loop_primitives
+        return io_lock, flush_wakeup
+    
+    def _get_hot(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Return a hot-tier conversation and mark it as recently used."""
+        conversation = self.conversations.get(conversation_id)
+        if conversation is not None:
+            self.conversations.move_to_end(conversation_id)
+        return conversation
+    
+    async def _load(self, conversation_id: str, create: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get a conversation from the hot tier, promoting it from disk on a miss.
+        
+        Args:
+            conversation_id: Unique identifier for the conversation
+            create: Create an empty conversation if it does not exist anywhere
+            
+        Returns:
+            The hot-tier conversation data, or None if it does not exist
+        """
+        conversation = self._get_hot(conversation_id)
+        if conversation is not None:
+            return conversation
+            
+        if self._db is not None:
+            conversation = await self._run_db(self._read_cold, conversation_id)
+            
+            # Another task may have promoted it while we were reading
+            hot = self._get_hot(conversation_id)
+            if hot is not None:
+                return hot
+                
+        if conversation is None:
+            if not create:
+                return None
+            conversation = {"history": [], "context": {}}
+            self._next_seq.setdefault(conversation_id, 0)
+            
+        self.conversations[conversation_id] = conversation
+        await self._evict()
+        return conversation
+    
+    def _read_cold(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Read a full conversation from the cold tier (worker thread)."""
+        db = self._connection()
+        rows = db.execute(
+            "SELECT seq, payload FROM messages WHERE conversation_id = ? ORDER BY seq",
+            (conversation_id,),
+        ).fetchall()
+        context_row = db.execute(
+            "SELECT payload FROM contexts WHERE conversation_id = ?",
+            (conversation_id,),
+        ).fetchone()
+        
+        if not rows and context_row is None:
+            return None
+            
+        self._next_seq[conversation_id] = rows[-1][0] + 1 if rows else 0
+        return {
+            "history": [_loads(payload) for _, payload in rows],
+            "context": _loads(context_row[0]) if context_row else {},
+        }
+    
+    async def _evict(self) -> None:
+        """Evict least recently used conversations beyond the hot-tier size."""
+        if self._db is None:
+            return  # Without a cold tier, eviction would lose data
+            
+        while len(self.conversations) > self.hot_sessions:
+            conversation_id = next(iter(self.conversations))
+            await self._run_db(contexts=[conversation_id])
+            
+            # Keep the session if its context changed during the flush
+            if conversation_id not in self._dirty_contexts:
+                self.conversations.pop(conversation_id, None)
+                # Reloading from the cold tier restores the next sequence number
+                self._next_seq.pop(conversation_id, None)
+    
+    def _take_batch(
+        self,
+        contexts: Iterable[str] = (),
+    ) -> Tuple[List[Tuple[Any, ...]], List[Tuple[str, bytes]]]:
+        """
+        Detach buffered writes so new ones can accumulate during the flush.
+        
+        Args:
+            contexts: Conversations whose dirty contexts should be included
+            
+        Returns:
+            Tuple of (message rows, context rows)
+        """
+        messages = self._pending_messages
+        self._pending_messages = []
         
+        context_rows = []
+        for cid in contexts:
+            if cid not in self._dirty_contexts:
+                continue
+            self._dirty_contexts.discard(cid)
+            conversation = self.conversations.get(cid)
+            if conversation is not None:
+                context_rows.append((cid, _dumps(conversation.get("context", {}))))
+                
+        return messages, context_rows
+    
+    def _write_batch(
+        self,
+        messages: List[Tuple[Any, ...]],
+        context_rows: List[Tuple[str, bytes]],
+    ) -> None:
+        """Write detached buffers to the cold tier (worker thread)."""
+        if not messages and not context_rows:
+            return
+            
+        db = self._connection()
+        with db:
+            if messages:
+                self._insert_messages(db, messages)
+            if context_rows:
+                db.executemany(
+                    "INSERT OR REPLACE INTO contexts (conversation_id, payload) VALUES (?, ?)",
+                    context_rows,
+                )
+    
+    @staticmethod
+    def _insert_messages(db: sqlite3.Connection, messages: List[Tuple[Any, ...]]) -> None:
+        """Insert message rows, dropping any row SQLite cannot bind (worker thread)."""
+        try:
+            db.executemany(_INSERT_MESSAGE, messages)
+        except (sqlite3.InterfaceError, sqlite3.ProgrammingError):
+            # Such a row would fail every retry, so write the others one by one
+            for row in messages:
+                try:
+                    db.execute(_INSERT_MESSAGE, row)
+                except (sqlite3.InterfaceError, sqlite3.ProgrammingError) as e:
+                    logger.error(f"Dropping message {row[1]} of conversation {row[0]!r}: {e}")
+    
+    async def _run_db(
+        self,
+        func: Optional[Callable[..., Any]] = None,
+        *args: Any,
+        contexts: Iterable[str] = (),
+    ) -> Any:
+        """
+        Flush buffered messages, then run a database operation off the event loop.
+        
+        Buffered messages are always written first so reads observe every
+        message accepted so far.
+        
+        Args:
+            func: Optional operation to run after the flush (in the worker thread)
+            *args: Arguments for func
+            contexts: Conversations whose dirty contexts should also be written
+            
+        Returns:
+            Result of func, or None
+        """
+        io_lock, _ = self._primitives()
+        async with io_lock:
+            messages, context_rows = self._take_batch(contexts)
+            
+            def work() -> Any:
+                with self._db_lock:
+                    self._write_batch(messages, context_rows)
+                    return func(*args) if func is not None else None
+                
+            try:
+                # run_in_executor rather than asyncio.to_thread, which needs 3.9
+                return await asyncio.get_running_loop().run_in_executor(None, work)
+            except BaseException:
+                # Put the detached rows back so a later flush can retry them
+                self._pending_messages[:0] = messages
+                self._dirty_contexts.update(cid for cid, _ in context_rows)
+                raise
+    
+    def _schedule_flush(self) -> None:
+        """Start the background flusher, waking it early for large batches."""
+        _, flush_wakeup = self._primitives()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_periodically())
+            
+        if len(self._pending_messages) >= self.flush_batch_size:
+            flush_wakeup.set()
+    
+    async def _flush_periodically(self) -> None:
+        """Write-behind loop: flush buffered writes every flush_interval seconds."""
+        _, flush_wakeup = self._primitives()
+        while self._db is not None and (self._pending_messages or self._dirty_contexts):
+            # A failed flush keeps its rows buffered; retry on the next round
+            try:
+                try:
+                    await asyncio.wait_for(flush_wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                flush_wakeup.clear()
+                
+                await self.flush()
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Background memory flush failed: {e}")
+    
     async def get_conversation_context(self, conversation_id: str) -> Dict[str, Any]:
         """
         Get conversation context for a given conversation ID.
@@ -35,14 +378,15 @@ class MemoryService:
         Returns:
             Dictionary containing conversation context
         """
-        if conversation_id not in self.conversations:
+        conversation = await self._load(conversation_id)
+        if conversation is None:
             return {}
-        
-        return self.conversations[conversation_id].get("context", {})
+            
+        return conversation.get("context", {})
     
     async def store_conversation_context(
-        self, 
-        conversation_id: str, 
+        self,
+        conversation_id: str,
         context: Dict[str, Any]
     ) -> None:
         """
@@ -52,14 +396,17 @@ class MemoryService:
             conversation_id: Unique identifier for the conversation
             context: Context data to store
         """
-        if conversation_id not in self.conversations:
-            self.conversations[conversation_id] = {}
+        conversation = await self._load(conversation_id, create=True)
+        assert conversation is not None  # create=True always returns one
+        conversation["context"] = context
         
-        self.conversations[conversation_id]["context"] = context
+        if self._db is not None:
+            self._dirty_contexts.add(conversation_id)
+            self._schedule_flush()
     
     async def get_conversation_history(
-        self, 
-        conversation_id: str, 
+        self,
+        conversation_id: str,
         limit: int = 10
     ) -> List[Dict[str, Any]]:
         """
@@ -72,15 +419,30 @@ class MemoryService:
         Returns:
             List of conversation messages
         """
-        if conversation_id not in self.conversations:
+        conversation = self._get_hot(conversation_id)
+        if conversation is not None:
+            history = conversation.get("history", [])
+            return history[-limit:] if limit > 0 else history
+            
+        if self._db is None:
             return []
+            
+        # Cold read: fetch only the requested tail without promoting the session
+        query = "SELECT payload FROM messages WHERE conversation_id = ? ORDER BY seq DESC"
+        params: Tuple[Any, ...] = (conversation_id,)
+        if limit > 0:
+            query += " LIMIT ?"
+            params += (limit,)
         
-        history = self.conversations[conversation_id].get("history", [])
-        return history[-limit:] if limit > 0 else history
+        def read_tail() -> List[Dict[str, Any]]:
+            rows = self._connection().execute(query, params).fetchall()
+            return [_loads(payload) for (payload,) in reversed(rows)]
+            
+        return await self._run_db(read_tail)
     
     async def add_conversation_message(
-        self, 
-        conversation_id: str, 
+        self,
+        conversation_id: str,
         message: Dict[str, Any]
     ) -> None:
         """
@@ -90,10 +452,23 @@ class MemoryService:
             conversation_id: Unique identifier for the conversation
             message: Message data to add
         """
-        if conversation_id not in self.conversations:
-            self.conversations[conversation_id] = {"history": [], "context": {}}
+        conversation = await self._load(conversation_id, create=True)
+        assert conversation is not None  # create=True always returns one
+        conversation.setdefault("history", []).append(message)
         
-        self.conversations[conversation_id]["history"].append(message)
+        if self._db is None:
+            return
+            
+        seq = self._next_seq.get(conversation_id, 0)
+        self._next_seq[conversation_id] = seq + 1
+        self._pending_messages.append((
+            conversation_id,
+            seq,
+            _text_column(message.get("role")),
+            _text_column(message.get("content")),
+            _dumps(message),
+        ))
+        self._schedule_flush()
     
     async def clear_conversation(self, conversation_id: str) -> None:
         """
@@ -104,36 +479,108 @@ class MemoryService:
         """
         if conversation_id in self.conversations:
             del self.conversations[conversation_id]
+            
+        self._next_seq.pop(conversation_id, None)
+        
+        if self._db is not None:
+            self._pending_messages = [
+                row for row in self._pending_messages if row[0] != conversation_id
+            ]
+            self._dirty_contexts.discard(conversation_id)
+            
+            def delete_rows() -> None:
+                db = self._connection()
+                with db:
+                    db.execute("DELETE FROM messages WHERE conversation_id = ?", (conversation_id,))
+                    db.execute("DELETE FROM contexts WHERE conversation_id = ?", (conversation_id,))
+                    
+            await self._run_db(delete_rows)
     
     async def search_conversations(
-        self, 
-        query: str, 
+        self,
+        query: str,
         limit: int = 5
     ) -> List[Dict[str, Any]]:
         """
         Search through stored conversations.
         
+        Matches are ranked by how often the query occurs in the message, then
+        by recency (most recently used conversation, latest message first).
+        Only the best ``limit`` candidates are kept while scanning.
+        
         Args:
             query: Search query
             limit: Maximum number of results to return
             
         Returns:
-            List of matching conversation segments
+            List of matching conversation segments, best match first
         """
-        results = []
+        if limit <= 0:
+            return []
+            
         query_lower = query.lower()
+        hot_ids = frozenset(self.conversations)
+        
+        def hot_candidates() -> Iterator[Tuple[Any, ...]]:
+            for rank, conversation_id in enumerate(reversed(self.conversations)):
+                history = self.conversations[conversation_id].get("history", [])
+                for index, message in enumerate(history):
+                    score = _match_score(message.get("content"), query_lower)
+                    if score:
+                        yield (-score, rank, -index, conversation_id, message)
+                        
+        top = heapq.nsmallest(limit, hot_candidates())
         
-        for conversation_id, conversation_data in self.conversations.items():
-            history = conversation_data.get("history", [])
+        if self._db is not None:
+            # Conversations that only live in the cold tier rank after hot ones
+            cold_rank = len(hot_ids)
             
-            for message in history:
-                if "content" in message and query_lower in message["content"].lower():
-                    results.append({
-                        "conversation_id": conversation_id,
-                        "message": message
-                    })
-                    
-                    if len(results) >= limit:
-                        return results
+            def scan_cold() -> List[Tuple[Any, ...]]:
+                rows = self._connection().execute(
+                    "SELECT conversation_id, seq, content, payload FROM messages"
+                )
+                
+                def cold_candidates() -> Iterator[Tuple[Any, ...]]:
+                    for conversation_id, seq, content, payload in rows:
+                        if conversation_id in hot_ids:
+                            continue
+                        score = _match_score(content, query_lower)
+                        if score:
+                            yield (-score, cold_rank, -seq, conversation_id, payload)
+                            
+                # Decode payloads only for the rows that made the cut
+                return [
+                    (*key, _loads(payload))
+                    for *key, payload in heapq.nsmallest(limit, cold_candidates())
+                ]
+                
+            top = heapq.nsmallest(limit, top + await self._run_db(scan_cold))
+            
+        return [
+            {"conversation_id": conversation_id, "message": message}
+            for _, _, _, conversation_id, message in top
+        ]
+    
+    async def flush(self) -> None:
+        """Persist all buffered messages and contexts to the cold tier."""
+        if self._db is None:
+            return
+            
+        await self._run_db(contexts=list(self._dirty_contexts))
+    
+    async def close(self) -> None:
+        """Flush buffered writes and close the persistent store."""
+        if self._db is None:
+            return
+            
+        # Let the background flusher drain instead of cancelling it mid-write
+        if self._flush_task is not None and not self._flush_task.done():
+            _, flush_wakeup = self._primitives()
+            flush_wakeup.set()
+            await self._flush_task
+        self._flush_task = None
         
-        return results
\ No newline at end of file
+        await self.flush()
+        with self._db_lock:
+            self._connection().close()
+        self._db = None
@@ -0,0 +1,335 @@
+"""
+Keyword-bucket matching shared by the persona experts.
+
+Experts classify user input into named buckets by checking whether any of a
+bucket's keywords occurs in the lowercased input. These helpers keep that
+substring semantics but run it over precomputed tuples in plain loops, the
+cheapest form for the interpreter (no per-call dict building, generator
+frames or repeated lowercasing). The module is fully typed so it can be
+compiled with mypyc without changes.
+
+Lowercasing and tokenizing the input is done once per request through
+:class:`InputFeatures`, which personas share via ``context["features"]``.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+import re
+
+# Optional speed-up (pyahocorasick); the pure-Python paths below are the fallback
+try:
+    import ahocorasick  # type: ignore[import-not-found]
+    _ahocorasick_available = True
+except ImportError:
+    _ahocorasick_available = False
+
+
+Buckets = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+# (name, single-word keywords, multi-word phrases) per bucket
+WordBuckets = Tuple[Tuple[str, FrozenSet[str], Tuple[str, ...]], ...]
+
+# (keywords, value) rules, checked in order
+Rules = Tuple[Tuple[Tuple[str, ...], str], ...]
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class InputFeatures:
+    """Features of one user input, computed once and shared by all personas."""
+    
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ("text", "lower", "tokens", "length")
+    
+    text: str
+    lower: str
+    tokens: FrozenSet[str]
+    length: int
+    
+    @classmethod
+    def from_text(cls, text: str) -> "InputFeatures":
+        """Lowercase and tokenize text in a single pass."""
+        # str.lower() already has an ASCII fast path in CPython; translate
+        # tables and bytes round-trips measured slower, so keep it here.
+        lower = text.lower()
+        return cls(
+            text=text,
+            lower=lower,
+            tokens=frozenset(_TOKEN_PATTERN.findall(lower)),
+            length=len(text),
+        )
+
+
+def get_input_features(text: str, context: Optional[Dict[str, Any]] = None) -> InputFeatures:
+    """
+    Get the features for text, reusing ``context["features"]`` when it matches.
+    
+    Features computed here are stored back into the context so that later
+    personas (and postprocess_response) handling the same input reuse them.
+    
+    Args:
+        text: The user's input text
+        context: Request context shared between persona calls
+        
+    Returns:
+        InputFeatures for text
+    """
+    if context is not None:
+        features = context.get("features")
+        if isinstance(features, InputFeatures) and features.text == text:
+            return features
+            
+    features = InputFeatures.from_text(text)
+    if context is not None:
+        context["features"] = features
+    return features
+
+
+def make_buckets(mapping: Dict[str, Sequence[str]]) -> Buckets:
+    """
+    Freeze a ``{bucket: keywords}`` mapping for use with :func:`classify`.
+    
+    Args:
+        mapping: Bucket names mapped to their keywords
+        
+    Returns:
+        Tuple of (bucket name, lowercased keywords) pairs in mapping order
+    """
+    return tuple(
+        (name, tuple(keyword.lower() for keyword in keywords))
+        for name, keywords in mapping.items()
+    )
+
+
+def classify(text_lower: str, buckets: Buckets) -> List[str]:
+    """
+    Find the buckets with at least one keyword in the text.
+    
+    Substring checks in a loop beat one compiled alternation per bucket for
+    tables of this size (about 4us vs 11us for the creativity tables, and
+    29us with word boundaries), so keep them as plain loops.
+    
+    Args:
+        text_lower: Lowercased input text
+        buckets: Buckets built with :func:`make_buckets`
+        
+    Returns:
+        Names of the matching buckets, in bucket order
+    """
+    matched = []
+    for name, keywords in buckets:
+        for keyword in keywords:
+            if keyword in text_lower:
+                matched.append(name)
+                break
+    return matched
+
+
+def make_word_buckets(mapping: Dict[str, Sequence[str]]) -> WordBuckets:
+    """
+    Freeze a ``{bucket: keywords}`` mapping for use with :func:`classify_words`.
+    
+    Args:
+        mapping: Bucket names mapped to their keywords
+        
+    Returns:
+        Tuple of (bucket name, single words, phrases) in mapping order
+    """
+    word_buckets = []
+    for name, keywords in mapping.items():
+        lowered = [keyword.lower() for keyword in keywords]
+        words = frozenset(keyword for keyword in lowered if _TOKEN_PATTERN.fullmatch(keyword))
+        phrases = tuple(keyword for keyword in lowered if keyword not in words)
+        word_buckets.append((name, words, phrases))
+    return tuple(word_buckets)
+
+
+def classify_words(features: InputFeatures, buckets: WordBuckets) -> List[str]:
+    """
+    Find the buckets with a keyword in the input, matching whole words.
+    
+    Single-word keywords are looked up in the token set, so "time" does not
+    match "sometimes"; phrases such as "figure out" are searched in the
+    lowercased text.
+    
+    Args:
+        features: Features of the input
+        buckets: Buckets built with :func:`make_word_buckets`
+        
+    Returns:
+        Names of the matching buckets, in bucket order
+    """
+    matched = []
+    tokens = features.tokens
+    for name, words, phrases in buckets:
+        if not words.isdisjoint(tokens) or contains_any(features.lower, phrases):
+            matched.append(name)
+    return matched
+
+
+def first_word_match(features: InputFeatures, buckets: WordBuckets, default: str) -> str:
+    """
+    Return the first bucket with a keyword in the input, matching whole words.
+    
+    Same matching as :func:`classify_words`, but stops at the first hit for
+    callers that only use the highest-priority bucket.
+    
+    Args:
+        features: Features of the input
+        buckets: Buckets built with :func:`make_word_buckets`, in priority order
+        default: Value returned when no bucket matches
+        
+    Returns:
+        Name of the first matching bucket, or default
+    """
+    tokens = features.tokens
+    for name, words, phrases in buckets:
+        if not words.isdisjoint(tokens) or contains_any(features.lower, phrases):
+            return name
+    return default
+
+
+def contains_any(text_lower: str, keywords: Iterable[str]) -> bool:
+    """Check whether any keyword occurs in the lowercased text."""
+    for keyword in keywords:
+        if keyword in text_lower:
+            return True
+    return False
+
+
+def first_match(text_lower: str, rules: Rules, default: str) -> str:
+    """
+    Return the value of the first rule with a keyword in the text.
+    
+    Args:
+        text_lower: Lowercased input text
+        rules: (keywords, value) pairs in priority order
+        default: Value returned when no rule matches
+        
+    Returns:
+        The matching rule's value, or default
+    """
+    for keywords, value in rules:
+        for keyword in keywords:
+            if keyword in text_lower:
+                return value
+    return default
+
+
+def count_matches(text_lower: str, keywords: Iterable[str]) -> int:
+    """Count how many keywords occur in the lowercased text."""
+    count = 0
+    for keyword in keywords:
+        if keyword in text_lower:
+            count += 1
+    return count
+
+
+class KeywordIndex:
+    """
+    Multi-pattern keyword matcher over named keyword groups.
+    
+    Finds every keyword occurring in a text with a single Aho-Corasick pass
+    when pyahocorasick is installed; otherwise each distinct keyword is
+    checked once, however many groups share it. Keywords are matched as
+    given (callers pass lowercased text and keywords).
+    """
+    
+    __slots__ = ("_owners", "_automaton")
+    
+    def __init__(self, groups: Mapping[Any, Iterable[str]]):
+        """
+        Build the index.
+        
+        Args:
+            groups: Group names (any hashable) mapped to their keywords
+        """
+        owners: Dict[str, List[Hashable]] = {}
+        for name, keywords in groups.items():
+            for keyword in keywords:
+                owners.setdefault(keyword, []).append(name)
+        self._owners = owners
+        
+        self._automaton = None
+        if _ahocorasick_available and owners:
+            automaton = ahocorasick.Automaton()
+            for keyword in owners:
+                if keyword:
+                    automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    def find(self, text_lower: str) -> Set[str]:
+        """Return the distinct keywords that occur in the text."""
+        if self._automaton is None:
+            return {keyword for keyword in self._owners if keyword in text_lower}
+            
+        found = {keyword for _, keyword in self._automaton.iter(text_lower)}
+        if "" in self._owners:
+            found.add("")  # Matches everywhere, like `"" in text`
+        return found
+    
+    def count(self, text_lower: str) -> Dict[Hashable, int]:
+        """
+        Count matching keywords per group.
+        
+        Args:
+            text_lower: Lowercased input text
+            
+        Returns:
+            Group names mapped to the number of their keywords found in the
+            text (groups without matches are omitted)
+        """
+        counts: Dict[Hashable, int] = {}
+        for keyword in self.find(text_lower):
+            for name in self._owners[keyword]:
+                counts[name] = counts.get(name, 0) + 1
+        return counts
+
+
+class BucketClassifier:
+    """
+    Classify text into several bucket sets at once.
+    
+    With pyahocorasick installed, every keyword of every bucket set is found
+    in a single pass over the text. Without it, each set is scanned with
+    :func:`classify`, which beats an index lookup for tables this small.
+    """
+    
+    __slots__ = ("bucket_sets", "_index")
+    
+    def __init__(self, *bucket_sets: Buckets):
+        """
+        Build the classifier.
+        
+        Args:
+            *bucket_sets: Buckets built with :func:`make_buckets`
+        """
+        self.bucket_sets = bucket_sets
+        self._index: Optional[KeywordIndex] = None
+        if _ahocorasick_available:
+            self._index = KeywordIndex({
+                (position, name): keywords
+                for position, buckets in enumerate(bucket_sets)
+                for name, keywords in buckets
+            })
+    
+    def classify(self, text_lower: str) -> Tuple[List[str], ...]:
+        """
+        Find the matching buckets of every set.
+        
+        Args:
+            text_lower: Lowercased input text
+            
+        Returns:
+            One list of matching bucket names per bucket set, in bucket order
+        """
+        if self._index is None:
+            return tuple(classify(text_lower, buckets) for buckets in self.bucket_sets)
+            
+        found = self._index.find(text_lower)
+        return tuple(
+            [name for name, keywords in buckets if not found.isdisjoint(keywords)]
+            for buckets in self.bucket_sets
+        )
@@ -8,6 +8,7 @@ import logging
 from typing import Dict, List, Optional, Any
 import re
 
+from ._routing import classify, get_input_features, make_buckets
 from .base import BasePersona
 from .prompts import get_persona_metadata
 
@@ -15,6 +16,41 @@ from .prompts import get_persona_metadata
 logger = logging.getLogger(__name__)
 
 
+# Keyword buckets used by preprocess_input
+_APPEARANCE_AREAS = make_buckets({
+    "clothing": ["clothes", "outfit", "dress", "wear", "fashion", "style"],
+    "grooming": ["hair", "makeup", "grooming", "clean", "tidy", "neat"],
+    "presentation": ["present", "presentation", "slides", "visual", "design"],
+    "environment": ["room", "space", "environment", "decor", "layout"],
+    "digital": ["website", "app", "interface", "digital", "online"],
+    "body_language": ["posture", "stance", "gesture", "expression", "body"]
+})
+
+_AESTHETIC_GOALS = make_buckets({
+    "professional": ["professional", "business", "work", "office", "corporate"],
+    "casual": ["casual", "relaxed", "everyday", "comfortable", "informal"],
+    "elegant": ["elegant", "sophisticated", "classy", "refined", "formal"],
+    "creative": ["creative", "artistic", "unique", "expressive", "bold"],
+    "minimalist": ["minimal", "simple", "clean", "understated", "basic"],
+    "trendy": ["trendy", "fashionable", "modern", "current", "stylish"]
+})
+
+_OCCASION_CONTEXTS = make_buckets({
+    "interview": ["interview", "job", "hiring", "recruiting"],
+    "meeting": ["meeting", "conference", "presentation", "business"],
+    "social": ["party", "social", "gathering", "event", "celebration"],
+    "dating": ["date", "romantic", "attraction", "dating"],
+    "daily": ["daily", "everyday", "routine", "regular"]
+})
+
+# Requests for appearance help, matched against the lowercased input
+_HELP_PATTERNS = (
+    re.compile(r"how to (dress|look|appear|present)"),
+    re.compile(r"help me (dress|look|appear|present)"),
+    re.compile(r"(improve|enhance|better).*(appearance|look|style)"),
+)
+
+
 class AppearanceExpert(BasePersona):
     """
     Appearance Expert specializing in visual presentation, aesthetics, and style guidance.
@@ -23,6 +59,8 @@ class AppearanceExpert(BasePersona):
     Helps users present themselves and their ideas in the most aesthetically pleasing way.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         memory_service=None,
@@ -57,59 +95,24 @@ class AppearanceExpert(BasePersona):
         Returns:
             Preprocessed input with appearance analysis
         """
+        input_lower = get_input_features(user_input, context).lower
+        
         # Identify appearance context
-        appearance_indicators = []
-        
-        # Check for appearance areas
-        appearance_areas = {
-            "clothing": ["clothes", "outfit", "dress", "wear", "fashion", "style"],
-            "grooming": ["hair", "makeup", "grooming", "clean", "tidy", "neat"],
-            "presentation": ["present", "presentation", "slides", "visual", "design"],
-            "environment": ["room", "space", "environment", "decor", "layout"],
-            "digital": ["website", "app", "interface", "digital", "online"],
-            "body_language": ["posture", "stance", "gesture", "expression", "body"]
-        }
-        
-        for area_type, keywords in appearance_areas.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                appearance_indicators.append(area_type)
+        appearance_indicators = classify(input_lower, _APPEARANCE_AREAS)
         
         # Check for aesthetic goals
-        aesthetic_goals = []
-        goals = {
-            "professional": ["professional", "business", "work", "office", "corporate"],
-            "casual": ["casual", "relaxed", "everyday", "comfortable", "informal"],
-            "elegant": ["elegant", "sophisticated", "classy", "refined", "formal"],
-            "creative": ["creative", "artistic", "unique", "expressive", "bold"],
-            "minimalist": ["minimal", "simple", "clean", "understated", "basic"],
-            "trendy": ["trendy", "fashionable", "modern", "current", "stylish"]
-        }
-        
-        for goal_type, keywords in goals.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                aesthetic_goals.append(goal_type)
+        aesthetic_goals = classify(input_lower, _AESTHETIC_GOALS)
         
         # Check for context/occasion
-        occasion_contexts = []
-        contexts = {
-            "interview": ["interview", "job", "hiring", "recruiting"],
-            "meeting": ["meeting", "conference", "presentation", "business"],
-            "social": ["party", "social", "gathering", "event", "celebration"],
-            "dating": ["date", "romantic", "attraction", "dating"],
-            "daily": ["daily", "everyday", "routine", "regular"]
-        }
-        
-        for context_type, keywords in contexts.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                occasion_contexts.append(context_type)
+        occasion_contexts = classify(input_lower, _OCCASION_CONTEXTS)
         
         # Check for specific concerns
         concerns = []
-        if "improve" in user_input.lower() or "better" in user_input.lower():
+        if "improve" in input_lower or "better" in input_lower:
             concerns.append("improvement")
-        if "confidence" in user_input.lower() or "comfortable" in user_input.lower():
+        if "confidence" in input_lower or "comfortable" in input_lower:
             concerns.append("confidence")
-        if "impression" in user_input.lower() or "perception" in user_input.lower():
+        if "impression" in input_lower or "perception" in input_lower:
             concerns.append("first_impression")
         
         # Add appearance context to the input
@@ -144,13 +147,8 @@ class AppearanceExpert(BasePersona):
         original_input = context.get("original_input", "")
         
         # Check if user is asking for appearance help
-        help_patterns = [
-            r"how to (dress|look|appear|present)",
-            r"help me (dress|look|appear|present)",
-            r"(improve|enhance|better).*(appearance|look|style)"
-        ]
-        
-        if any(re.search(pattern, original_input.lower()) for pattern in help_patterns):
+        input_lower = get_input_features(original_input, context).lower
+        if any(pattern.search(input_lower) for pattern in _HELP_PATTERNS):
             # Add a practical appearance tip
             tip = self._get_appearance_tip(original_input)
             if tip:
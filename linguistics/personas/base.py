@@ -11,6 +11,7 @@ import logging
 
 from ..memory import MemoryService
 from ..rag import RAGService
+from ._routing import count_matches
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,16 @@ logger = logging.getLogger(__name__)
 class BasePersona(ABC):
     """Base class for all expert personas in the linguistics system."""
     
+    # Personas are created per request; fixed slots avoid a per-instance __dict__.
+    # Subclasses declare their own (possibly empty) __slots__ to keep this benefit.
+    __slots__ = (
+        "name",
+        "description",
+        "routing_keywords",
+        "memory_service",
+        "rag_service",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -76,8 +87,9 @@ class BasePersona(ABC):
         """
         user_input_lower = user_input.lower()
         
-        # Simple keyword matching - can be enhanced with semantic similarity
-        keyword_matches = sum(1 for keyword in self.routing_keywords if keyword in user_input_lower)
+        # Simple keyword matching - can be enhanced with semantic similarity.
+        # Keywords are stems matched as substrings, so a set lookup would not apply.
+        keyword_matches = count_matches(user_input_lower, self.routing_keywords)
         confidence = keyword_matches / len(self.routing_keywords) if self.routing_keywords else 0
         
         return confidence >= confidence_threshold
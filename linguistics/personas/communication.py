@@ -8,6 +8,7 @@ import logging
 from typing import Dict, List, Optional, Any
 import re
 
+from ._routing import contains_any, count_matches, get_input_features
 from .base import BasePersona
 from .prompts import get_persona_metadata
 
@@ -15,6 +16,19 @@ from .prompts import get_persona_metadata
 logger = logging.getLogger(__name__)
 
 
+# Indicator keywords used by preprocess_input
+_VAGUE_WORDS = ("thing", "stuff", "something", "maybe", "sort of", "kind of")
+_PASSIVE_INDICATORS = ("was done by", "is being", "has been", "were made")
+_EMOTIONAL_WORDS = ("feel", "angry", "sad", "happy", "frustrated", "confused")
+
+# Requests for help with communication, matched against the lowercased input
+_HELP_PATTERNS = (
+    re.compile(r"how to (communicate|talk|speak|explain)"),
+    re.compile(r"help me (communicate|talk|speak|explain)"),
+    re.compile(r"improve my (communication|speaking|writing)"),
+)
+
+
 class CommunicationExpert(BasePersona):
     """
     Communication Expert specializing in language, clarity, and interpersonal dynamics.
@@ -23,6 +37,8 @@ class CommunicationExpert(BasePersona):
     Helps users express themselves effectively and understand others deeply.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         memory_service=None,
@@ -57,23 +73,21 @@ class CommunicationExpert(BasePersona):
         Returns:
             Preprocessed input with communication analysis
         """
+        input_lower = get_input_features(user_input, context).lower
+        
         # Identify potential communication issues
         communication_issues = []
         
         # Check for clarity issues
-        vague_words = ["thing", "stuff", "something", "maybe", "sort of", "kind of"]
-        vague_count = sum(1 for word in vague_words if word in user_input.lower())
-        if vague_count > 2:
+        if count_matches(input_lower, _VAGUE_WORDS) > 2:
             communication_issues.append("clarity")
         
         # Check for passive voice indicators
-        passive_indicators = ["was done by", "is being", "has been", "were made"]
-        if any(indicator in user_input.lower() for indicator in passive_indicators):
+        if contains_any(input_lower, _PASSIVE_INDICATORS):
             communication_issues.append("active_voice")
         
         # Check for emotional context needs
-        emotional_words = ["feel", "angry", "sad", "happy", "frustrated", "confused"]
-        if any(word in user_input.lower() for word in emotional_words):
+        if contains_any(input_lower, _EMOTIONAL_WORDS):
             communication_issues.append("emotional_context")
         
         # Add communication context to the input
@@ -98,13 +112,8 @@ class CommunicationExpert(BasePersona):
         original_input = context.get("original_input", "")
         
         # Check if user is asking for help with communication
-        help_patterns = [
-            r"how to (communicate|talk|speak|explain)",
-            r"help me (communicate|talk|speak|explain)",
-            r"improve my (communication|speaking|writing)"
-        ]
-        
-        if any(re.search(pattern, original_input.lower()) for pattern in help_patterns):
+        input_lower = get_input_features(original_input, context).lower
+        if any(pattern.search(input_lower) for pattern in _HELP_PATTERNS):
             # Add a practical communication tip
             tip = self._get_communication_tip(original_input)
             if tip:
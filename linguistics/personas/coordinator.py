@@ -5,10 +5,14 @@ Orchestrates expert selection based on user intent, progress state,
 and conversation cues, falling back to default expert when confidence is low.
 """
 
+from collections import deque
+from functools import lru_cache
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, FrozenSet, List, Mapping, Optional, Any, Tuple
 import re
+import sys
 
+from ._routing import InputFeatures, KeywordIndex, contains_any, get_input_features
 from .base import BasePersona
 from .prompts import get_persona_metadata, get_all_personas_metadata, get_persona_routing_keywords
 
@@ -16,6 +20,82 @@ from .prompts import get_persona_metadata, get_all_personas_metadata, get_person
 logger = logging.getLogger(__name__)
 
 
+# Words signalling that the user wants to continue the current topic,
+# with the inflections the old substring check also matched
+_CONTINUATION_WORDS = frozenset({
+    "continue", "continues", "continued", "continuing", "continuation",
+    "more", "moreover",
+    "also",
+    "additionally", "additional",
+    "further", "furthermore",
+})
+
+# Explicit requests to move the conversation to another topic
+_TRANSITION_PATTERNS = (
+    re.compile(r"switch to (\w+)"),
+    re.compile(r"let's talk about (\w+)"),
+    re.compile(r"what about (\w+)"),
+    re.compile(r"can we discuss (\w+)"),
+)
+
+# Number of previous experts remembered for the recent-usage boost
+_EXPERT_HISTORY_SIZE = 3
+
+# Requests the coordinator handles itself
+_COORDINATION_KEYWORDS = (
+    "which expert", "help me choose", "coordinate", "orchestrate",
+    "switch expert", "change expert", "different perspective"
+)
+
+
+@lru_cache(maxsize=64)
+def _requested_topics(text_lower: str) -> FrozenSet[str]:
+    """
+    Find the topics a lowercased input explicitly asks to move to.
+    
+    Each transition pattern contributes its first match. The result is cached
+    because the coordinator asks once per persona for the same input.
+    
+    Args:
+        text_lower: Lowercased input text
+        
+    Returns:
+        Requested topic words
+    """
+    topics = set()
+    for pattern in _TRANSITION_PATTERNS:
+        match = pattern.search(text_lower)
+        if match:
+            topics.add(match.group(1))
+    return frozenset(topics)
+
+
+def _top_two(scores: Dict[str, float]) -> Tuple[Optional[str], float, float]:
+    """
+    Find the best persona and the two highest scores in a single pass.
+    
+    Args:
+        scores: Non-negative confidence scores by persona ID
+        
+    Returns:
+        Tuple of (best persona ID, best score, runner-up score); the ID is
+        None when no score is positive, and ties keep the first persona
+    """
+    best_id = None
+    best = second = 0.0
+    for persona_id, score in scores.items():
+        if score > best:
+            best_id, best, second = persona_id, score, best
+        elif score > second:
+            second = score
+    return best_id, best, second
+
+
+def _is_ambiguous(scores: Dict[str, float], best: float, second: float) -> bool:
+    """Check whether no expert is a clear winner, so the coordinator should clarify."""
+    return len(scores) >= 2 and best - second < 0.1
+
+
 class LinguisticsCoordinator(BasePersona):
     """
     Coordinator persona that manages expert selection and conversation flow.
@@ -24,6 +104,9 @@ class LinguisticsCoordinator(BasePersona):
     while maintaining conversation continuity and context.
     """
     
+    # No __slots__ here: the coordinator is a long-lived singleton holding
+    # mutable conversation state, so it keeps a regular instance __dict__.
+    
     def __init__(
         self,
         memory_service=None,
@@ -49,23 +132,49 @@ class LinguisticsCoordinator(BasePersona):
             rag_service=rag_service
         )
         
+        self._meta = coordinator_meta
         self.confidence_threshold = confidence_threshold
         self.fallback_expert = fallback_expert
         self.all_personas_metadata = get_all_personas_metadata()
-        self.routing_keywords = get_persona_routing_keywords()
+        
+        # Routing keywords of every persona, by persona ID; routing_keywords
+        # keeps the coordinator's own keywords like any other persona
+        self._persona_keywords: Mapping[str, List[str]] = get_persona_routing_keywords()
+        self._keyword_index = KeywordIndex(self._persona_keywords)
+        
+        # (persona_id, keyword count) for every persona the coordinator scores
+        self._scored_personas = tuple(
+            (pid, len(keywords))
+            for pid, keywords in self._persona_keywords.items()
+            if pid != "coordinator"
+        )
+        
+        # Expertise areas per persona, for the overlap check
+        self._expertise_sets = {
+            pid: frozenset(meta.expertise_areas)
+            for pid, meta in self.all_personas_metadata.items()
+        }
+        
+        # Topic word -> owning persona (first persona in metadata order wins)
+        self._topic_to_persona: Dict[str, str] = {}
+        for pid, meta in self.all_personas_metadata.items():
+            for topic in meta.routing_keywords:
+                self._topic_to_persona.setdefault(topic, pid)
+            for topic in meta.expertise_areas:
+                self._topic_to_persona.setdefault(topic, pid)
         
         # Conversation state tracking
         self.current_expert: Optional[str] = None
-        self.expert_history: List[str] = []
+        self.expert_history: Deque[str] = deque(maxlen=_EXPERT_HISTORY_SIZE)
         self.conversation_context: Dict[str, Any] = {}
         
     def get_system_prompt(self) -> str:
         """Get the system prompt for the coordinator."""
-        return get_persona_metadata("coordinator").system_prompt
+        return self._meta.system_prompt
     
     def get_expertise_areas(self) -> List[str]:
         """Get the coordinator's expertise areas."""
-        return get_persona_metadata("coordinator").expertise_areas
+        return self._meta.expertise_areas
     
     def analyze_user_intent(self, user_input: str, context: Dict[str, Any] = None) -> Dict[str, float]:
         """
@@ -81,19 +190,21 @@ class LinguisticsCoordinator(BasePersona):
         if context is None:
             context = {}
             
-        user_input_lower = user_input.lower()
+        features = get_input_features(user_input, context)
+        user_input_lower = features.lower
         intent_scores = {}
         
-        # Analyze keyword matches for each persona
-        for persona_id, keywords in self.routing_keywords.items():
-            if persona_id == "coordinator":  # Skip self
-                continue
-                
-            keyword_matches = sum(1 for keyword in keywords if keyword in user_input_lower)
-            keyword_score = keyword_matches / len(keywords) if keywords else 0
+        # Find keyword matches for all personas in a single scan
+        keyword_counts = self._keyword_index.count(user_input_lower)
+        
+        for persona_id, keyword_total in self._scored_personas:
+            keyword_matches = keyword_counts.get(persona_id, 0)
+            keyword_score = keyword_matches / keyword_total if keyword_total else 0
             
             # Boost score based on conversation context
-            context_boost = self._calculate_context_boost(persona_id, context, user_input)
+            context_boost = self._calculate_context_boost(
+                persona_id, context, user_input, features
+            )
             
             # Calculate final confidence score
             final_score = min(1.0, keyword_score + context_boost)
@@ -101,7 +212,13 @@ class LinguisticsCoordinator(BasePersona):
         
         return intent_scores
     
-    def _calculate_context_boost(self, persona_id: str, context: Dict[str, Any], user_input: str) -> float:
+    def _calculate_context_boost(
+        self,
+        persona_id: str,
+        context: Dict[str, Any],
+        user_input: str,
+        features: Optional[InputFeatures] = None
+    ) -> float:
         """
         Calculate context-based confidence boost for a persona.
         
@@ -109,52 +226,37 @@ class LinguisticsCoordinator(BasePersona):
             persona_id: The persona ID to calculate boost for
             context: Conversation context
             user_input: Current user input
+            features: Features of user_input, if the caller already has them
             
         Returns:
             Confidence boost value (0.0 to 0.3)
         """
         boost = 0.0
+        if features is None:
+            features = get_input_features(user_input, context)
         
         # Boost if continuing same topic area
         if self.current_expert:
-            current_meta = self.all_personas_metadata[self.current_expert]
-            target_meta = self.all_personas_metadata[persona_id]
-            
             # Check expertise overlap
-            overlap = set(current_meta.expertise_areas) & set(target_meta.expertise_areas)
-            if overlap:
+            current_areas = self._expertise_sets[self.current_expert]
+            if not current_areas.isdisjoint(self._expertise_sets[persona_id]):
                 boost += 0.1
             
-            # Check for continuation indicators
-            continuation_indicators = ["continue", "more", "also", "additionally", "further"]
-            if any(indicator in user_input.lower() for indicator in continuation_indicators):
+            # Check for continuation indicators (whole words, so "tomorrow"
+            # does not count as "more")
+            if not _CONTINUATION_WORDS.isdisjoint(features.tokens):
                 if persona_id == self.current_expert:
                     boost += 0.2
         
         # Boost based on recent expert usage (avoid rapid switching)
-        if self.expert_history:
-            recent_experts = self.expert_history[-3:]  # Last 3 experts
-            if persona_id in recent_experts:
-                boost += 0.05
+        if persona_id in self.expert_history:
+            boost += 0.05
         
         # Boost based on explicit transition requests
-        transition_patterns = [
-            r"switch to (\w+)",
-            r"let's talk about (\w+)",
-            r"what about (\w+)",
-            r"can we discuss (\w+)",
-        ]
-        
-        for pattern in transition_patterns:
-            match = re.search(pattern, user_input.lower())
-            if match:
-                requested_topic = match.group(1)
-                # Map topic to persona
-                for pid, meta in self.all_personas_metadata.items():
-                    if requested_topic in meta.routing_keywords or requested_topic in meta.expertise_areas:
-                        if pid == persona_id:
-                            boost += 0.3
-                        break
+        for requested_topic in _requested_topics(features.lower):
+            # Map topic to persona
+            if self._topic_to_persona.get(requested_topic) == persona_id:
+                boost += 0.3
         
         return min(0.3, boost)
     
@@ -170,17 +272,11 @@ class LinguisticsCoordinator(BasePersona):
             Selected persona ID
         """
         intent_scores = self.analyze_user_intent(user_input, context)
-        
-        # Find the best scoring expert
-        best_expert = None
-        best_score = 0.0
-        
-        for persona_id, score in intent_scores.items():
-            if score > best_score:
-                best_score = score
-                best_expert = persona_id
-        
-        # Use fallback if confidence is too low
+        best_expert, best_score, _ = _top_two(intent_scores)
+        return self._choose_expert(best_expert, best_score)
+    
+    def _choose_expert(self, best_expert: Optional[str], best_score: float) -> str:
+        """Pick the best expert, or the fallback when confidence is too low."""
         if best_score < self.confidence_threshold:
             logger.info(f"Low confidence ({best_score:.2f}), using fallback: {self.fallback_expert}")
             return self.fallback_expert
@@ -199,29 +295,55 @@ class LinguisticsCoordinator(BasePersona):
         Returns:
             True if coordinator should handle the input
         """
-        # Handle coordination-related requests
-        coordination_keywords = [
-            "which expert", "help me choose", "coordinate", "orchestrate",
-            "switch expert", "change expert", "different perspective"
-        ]
-        
-        user_input_lower = user_input.lower()
-        coordination_matches = sum(1 for kw in coordination_keywords if kw in user_input_lower)
+        # Normalize once and share it with analyze_user_intent
+        scratch: Dict[str, Any] = {}
+        features = get_input_features(user_input, scratch)
         
-        # Also handle when multiple experts have similar confidence
-        if coordination_matches > 0:
+        # Handle coordination-related requests
+        if contains_any(features.lower, _COORDINATION_KEYWORDS):
             return True
         
-        intent_scores = self.analyze_user_intent(user_input)
-        if len(intent_scores) == 0:
-            return True
+        # Only then pay for a full intent analysis: handle when multiple
+        # experts have similar confidence (there is always a score per expert)
+        intent_scores = self.analyze_user_intent(user_input, scratch)
+        _, best_score, second_score = _top_two(intent_scores)
+        return _is_ambiguous(intent_scores, best_score, second_score)
+    
+    def route_turn(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Answer every routing question for one user turn in a single pass.
         
-        # Check if there's a clear winner
-        sorted_scores = sorted(intent_scores.values(), reverse=True)
-        if len(sorted_scores) >= 2 and abs(sorted_scores[0] - sorted_scores[1]) < 0.1:
-            return True  # Ambiguous, coordinator should clarify
+        Equivalent to calling analyze_user_intent, select_best_expert and
+        should_handle_intent separately, but the input is normalized, scanned
+        and scored only once.
         
-        return False
+        Args:
+            user_input: The user's input text
+            context: Additional context
+            
+        Returns:
+            Dictionary with the selected "expert", its "confidence" (0.0 when
+            falling back), whether the coordinator "should_handle" the input
+            itself, and all intent "scores"
+        """
+        if context is None:
+            context = {}
+            
+        features = get_input_features(user_input, context)
+        intent_scores = self.analyze_user_intent(user_input, context)
+        best_expert, best_score, second_score = _top_two(intent_scores)
+        expert = self._choose_expert(best_expert, best_score)
+        
+        return {
+            "expert": expert,
+            # The fallback was not chosen on its score
+            "confidence": best_score if expert == best_expert else 0.0,
+            "should_handle": (
+                contains_any(features.lower, _COORDINATION_KEYWORDS)
+                or _is_ambiguous(intent_scores, best_score, second_score)
+            ),
+            "scores": intent_scores,
+        }
     
     def update_conversation_state(self, selected_expert: str, user_input: str) -> None:
         """
@@ -231,9 +353,15 @@ class LinguisticsCoordinator(BasePersona):
             selected_expert: The expert that was selected
             user_input: The user's input that triggered the selection
         """
+        # IDs from callers (e.g. decoded from a request) are interned so later
+        # comparisons with the registry's literal keys are identity checks
+        if selected_expert:
+            selected_expert = sys.intern(selected_expert)
+        
         # Update current expert
         if self.current_expert != selected_expert:
-            self.expert_history.append(self.current_expert) if self.current_expert else None
+            if self.current_expert:
+                self.expert_history.append(self.current_expert)
             self.current_expert = selected_expert
             
             # Log expert transition
@@ -250,25 +378,12 @@ class LinguisticsCoordinator(BasePersona):
         Returns:
             Transition message string
         """
-        from_meta = self.all_personas_metadata.get(from_expert)
         to_meta = self.all_personas_metadata.get(to_expert)
         
         if not to_meta:
             return "Let me help you with that..."
         
-        transition_messages = [
-            f"Let me bring in our {to_meta.name.lower()} for this.",
-            f"I'd like to bring in our {to_meta.name.lower()} to better assist you.",
-            f"For this, let me connect you with our {to_meta.name.lower()}.",
-        ]
-        
-        # Add context if there was a previous expert
-        if from_meta and from_meta != to_meta:
-            transition_messages.append(
-                f"Building on what we've discussed, let me bring in our {to_meta.name.lower()} for additional perspective."
-            )
-        
-        return transition_messages[0]  # Return first message for simplicity
+        return f"Let me bring in our {to_meta.name.lower()} for this."
     
     def preprocess_input(self, user_input: str, context: Dict[str, Any]) -> str:
         """
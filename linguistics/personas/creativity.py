@@ -4,10 +4,19 @@ Creativity Expert persona.
 Specializes in innovation, brainstorming, and creative problem-solving.
 """
 
+from functools import lru_cache
 import logging
 from typing import Dict, List, Optional, Any
 import re
 
+from ._routing import (
+    BucketClassifier,
+    classify_words,
+    contains_any,
+    get_input_features,
+    make_buckets,
+    make_word_buckets
+)
 from .base import BasePersona
 from .prompts import get_persona_metadata
 
@@ -15,6 +24,75 @@ from .prompts import get_persona_metadata
 logger = logging.getLogger(__name__)
 
 
+# Creative process needs
+_CREATIVE_NEEDS = make_buckets({
+    "brainstorming": ["brainstorm", "ideas", "generate", "come up with"],
+    "problem_solving": ["solve", "problem", "challenge", "obstacle", "issue"],
+    "innovation": ["innovate", "new", "different", "breakthrough", "invent"],
+    "inspiration": ["inspire", "inspiration", "creative block", "stuck", "blocked"],
+    "design": ["design", "create", "make", "build", "develop"],
+    "improvement": ["improve", "enhance", "better", "optimize", "refine"]
+})
+
+# Creative constraints (whole words: "time" must not match "sometimes"),
+# so inflected forms are listed explicitly
+_CONSTRAINTS = make_word_buckets({
+    "constraints": [
+        "limited", "limit", "limits", "limiting", "limitation", "limitations",
+        "constraint", "constraints", "constrained"
+    ],
+    "budget": ["budget", "budgets", "budgeting", "money"],
+    "time": ["time", "times", "timeline", "timelines", "timing", "deadline", "deadlines"]
+})
+
+# Creative domains
+_DOMAINS = make_buckets({
+    "art": ["art", "artistic", "painting", "drawing", "sculpture"],
+    "writing": ["write", "writing", "story", "poem", "novel", "content"],
+    "music": ["music", "song", "melody", "compose", "lyrics"],
+    "business": ["business", "startup", "entrepreneur", "company"],
+    "technology": ["tech", "software", "app", "digital", "technology"],
+    "education": ["teach", "learn", "education", "training", "curriculum"]
+})
+
+_CLASSIFIER = BucketClassifier(_CREATIVE_NEEDS, _DOMAINS)
+
+# Requests for creative help, matched against the lowercased input
+_HELP_PATTERNS = (
+    re.compile(r"how to (be|become|get).*(creative|innovative)"),
+    re.compile(r"help me (think|create|innovate)"),
+    re.compile(r"(boost|enhance|improve).*(creativity|innovation)"),
+)
+
+# Literal text that every help pattern requires; checked first so that most
+# turns skip the regex searches entirely
+_HELP_TRIGGERS = ("how to", "help me", "boost", "enhance", "improve")
+
+
+@lru_cache(maxsize=256)
+def _select_creativity_tip(input_lower: str) -> str:
+    """Pick the creativity tip for a lowercased input (cached, as phrasings repeat)."""
+    if "block" in input_lower or "stuck" in input_lower:
+        return "Break creative blocks by changing your environment, taking a walk, or working on a completely different task. Creativity often flows when you stop trying to force it."
+    
+    if "brainstorm" in input_lower or "ideas" in input_lower:
+        return "Try reverse brainstorming: Instead of asking 'How can we solve this?', ask 'How could we make this worse?' Then reverse those ideas. Also try the SCAMPER technique: Substitute, Combine, Adapt, Modify, Put to other uses, Eliminate, Reverse."
+    
+    if "innovate" in input_lower or "new" in input_lower:
+        return "Practice connecting unrelated concepts. Take two random objects or ideas and find 3 ways they're similar. Innovation often comes from making novel connections between existing ideas."
+    
+    if "problem" in input_lower or "solve" in input_lower:
+        return "Reframe your problem by asking 'What would this look like if it were easy?' or 'How would a child solve this?' Changing your perspective often reveals hidden solutions."
+    
+    if "creative" in input_lower and "habit" in input_lower:
+        return "Build a creativity habit with the 'two-minute rule': Spend just two minutes daily on a creative activity with no expectations. Small, consistent practices build creative momentum."
+    
+    if "design" in input_lower or "create" in input_lower:
+        return "Use the 'Yes, and...' principle from improv. Accept initial ideas without judgment and build upon them. The best ideas often emerge from iteration, not instant perfection."
+    
+    return "Practice divergent thinking by challenging assumptions. Ask 'What if the opposite were true?' or 'What if we removed this constraint entirely?' Constraints can actually spark creativity by forcing novel approaches."
+
+
 class CreativityExpert(BasePersona):
     """
     Creativity Expert specializing in innovation, brainstorming, and creative problem-solving.
@@ -23,6 +101,8 @@ class CreativityExpert(BasePersona):
     Helps users tap into their creative potential and find innovative approaches.
     """
     
+    __slots__ = ("_meta",)
+    
     def __init__(
         self,
         memory_service=None,
@@ -37,14 +117,15 @@ class CreativityExpert(BasePersona):
             memory_service=memory_service,
             rag_service=rag_service
         )
+        self._meta = creativity_meta
     
     def get_system_prompt(self) -> str:
         """Get the system prompt for the creativity expert."""
-        return get_persona_metadata("creativity").system_prompt
+        return self._meta.system_prompt
     
     def get_expertise_areas(self) -> List[str]:
         """Get the creativity expert's expertise areas."""
-        return get_persona_metadata("creativity").expertise_areas
+        return self._meta.expertise_areas
     
     def preprocess_input(self, user_input: str, context: Dict[str, Any]) -> str:
         """
@@ -57,46 +138,10 @@ class CreativityExpert(BasePersona):
         Returns:
             Preprocessed input with creativity analysis
         """
-        # Identify creative context
-        creative_indicators = []
-        
-        # Check for creative process needs
-        creative_needs = {
-            "brainstorming": ["brainstorm", "ideas", "generate", "come up with"],
-            "problem_solving": ["solve", "problem", "challenge", "obstacle", "issue"],
-            "innovation": ["innovate", "new", "different", "breakthrough", "invent"],
-            "inspiration": ["inspire", "inspiration", "creative block", "stuck", "blocked"],
-            "design": ["design", "create", "make", "build", "develop"],
-            "improvement": ["improve", "enhance", "better", "optimize", "refine"]
-        }
-        
-        for need_type, keywords in creative_needs.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                creative_indicators.append(need_type)
+        features = get_input_features(user_input, context)
         
-        # Check for creative constraints
-        constraint_indicators = []
-        if "limited" in user_input.lower() or "constraint" in user_input.lower():
-            constraint_indicators.append("constraints")
-        if "budget" in user_input.lower() or "money" in user_input.lower():
-            constraint_indicators.append("budget")
-        if "time" in user_input.lower() or "deadline" in user_input.lower():
-            constraint_indicators.append("time")
-        
-        # Check for creative domain
-        domain_indicators = []
-        domains = {
-            "art": ["art", "artistic", "painting", "drawing", "sculpture"],
-            "writing": ["write", "writing", "story", "poem", "novel", "content"],
-            "music": ["music", "song", "melody", "compose", "lyrics"],
-            "business": ["business", "startup", "entrepreneur", "company"],
-            "technology": ["tech", "software", "app", "digital", "technology"],
-            "education": ["teach", "learn", "education", "training", "curriculum"]
-        }
-        
-        for domain, keywords in domains.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                domain_indicators.append(domain)
+        creative_indicators, domain_indicators = _CLASSIFIER.classify(features.lower)
+        constraint_indicators = classify_words(features, _CONSTRAINTS)
         
         # Add creative context to the input
         context_elements = []
@@ -128,48 +173,25 @@ class CreativityExpert(BasePersona):
         original_input = context.get("original_input", "")
         
         # Check if user is asking for creative help
-        help_patterns = [
-            r"how to (be|become|get).*(creative|innovative)",
-            r"help me (think|create|innovate)",
-            r"(boost|enhance|improve).*(creativity|innovation)"
-        ]
-        
-        if any(re.search(pattern, original_input.lower()) for pattern in help_patterns):
+        input_lower = get_input_features(original_input, context).lower
+        if contains_any(input_lower, _HELP_TRIGGERS) and any(
+            pattern.search(input_lower) for pattern in _HELP_PATTERNS
+        ):
             # Add a practical creativity tip
-            tip = self._get_creativity_tip(original_input)
+            tip = self._get_creativity_tip(input_lower)
             if tip:
                 response = f"{response}\n\n🎨 **Creativity Tip:** {tip}"
         
         return response
     
-    def _get_creativity_tip(self, user_input: str) -> str:
+    def _get_creativity_tip(self, input_lower: str) -> str:
         """
         Generate a relevant creativity tip based on user input.
         
         Args:
-            user_input: The user's input
+            input_lower: The user's input, already lowercased
             
         Returns:
             Relevant creativity tip
         """
-        input_lower = user_input.lower()
-        
-        if "block" in input_lower or "stuck" in input_lower:
-            return "Break creative blocks by changing your environment, taking a walk, or working on a completely different task. Creativity often flows when you stop trying to force it."
-        
-        if "brainstorm" in input_lower or "ideas" in input_lower:
-            return "Try reverse brainstorming: Instead of asking 'How can we solve this?', ask 'How could we make this worse?' Then reverse those ideas. Also try the SCAMPER technique: Substitute, Combine, Adapt, Modify, Put to other uses, Eliminate, Reverse."
-        
-        if "innovate" in input_lower or "new" in input_lower:
-            return "Practice connecting unrelated concepts. Take two random objects or ideas and find 3 ways they're similar. Innovation often comes from making novel connections between existing ideas."
-        
-        if "problem" in input_lower or "solve" in input_lower:
-            return "Reframe your problem by asking 'What would this look like if it were easy?' or 'How would a child solve this?' Changing your perspective often reveals hidden solutions."
-        
-        if "creative" in input_lower and "habit" in input_lower:
-            return "Build a creativity habit with the 'two-minute rule': Spend just two minutes daily on a creative activity with no expectations. Small, consistent practices build creative momentum."
-        
-        if "design" in input_lower or "create" in input_lower:
-            return "Use the 'Yes, and...' principle from improv. Accept initial ideas without judgment and build upon them. The best ideas often emerge from iteration, not instant perfection."
-        
-        return "Practice divergent thinking by challenging assumptions. Ask 'What if the opposite were true?' or 'What if we removed this constraint entirely?' Constraints can actually spark creativity by forcing novel approaches."
\ No newline at end of file
+        return _select_creativity_tip(input_lower)
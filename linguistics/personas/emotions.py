@@ -4,10 +4,20 @@ Emotions Expert persona.
 Specializes in emotional intelligence, empathy, and mood analysis.
 """
 
+from functools import lru_cache
 import logging
 from typing import Dict, List, Optional, Any
 import re
 
+from ._routing import (
+    classify,
+    classify_words,
+    contains_any,
+    first_word_match,
+    get_input_features,
+    make_buckets,
+    make_word_buckets
+)
 from .base import BasePersona
 from .prompts import get_persona_metadata
 
@@ -15,6 +25,80 @@ from .prompts import get_persona_metadata
 logger = logging.getLogger(__name__)
 
 
+# Basic emotions mapping
+_EMOTION_KEYWORDS = make_buckets({
+    "joy": ["happy", "excited", "joyful", "pleased", "delighted", "glad", "cheerful"],
+    "sadness": ["sad", "down", "depressed", "unhappy", "miserable", "blue", "gloomy"],
+    "anger": ["angry", "mad", "furious", "irritated", "annoyed", "frustrated", "upset"],
+    "fear": ["afraid", "scared", "fearful", "anxious", "worried", "nervous", "terrified"],
+    "surprise": ["surprised", "shocked", "amazed", "astonished", "stunned"],
+    "disgust": ["disgusted", "revolted", "repulsed", "sickened"],
+    "love": ["love", "affection", "caring", "attached", "fond"],
+    "shame": ["ashamed", "embarrassed", "humiliated", "guilty"]
+})
+
+# Emotional intensity, checked in order and matched as whole words ("very"
+# must not fire on "every")
+_INTENSITY_INDICATORS = make_word_buckets({
+    "high": ["very", "extremely", "incredibly", "overwhelmingly", "completely"],
+    "moderate": ["quite", "rather", "somewhat", "pretty"],
+    "low": ["a little", "slightly", "a bit", "kind of"]
+})
+
+# Emotional regulation needs (single words match whole tokens, so
+# inflected forms are listed explicitly)
+_REGULATION_NEEDS = make_word_buckets({
+    "regulation": [
+        "control", "controls", "controlled", "controlling",
+        "manage", "manages", "managed", "managing", "management", "manager", "managers"
+    ],
+    "understanding": [
+        "understand", "understands", "understanding", "understood",
+        "misunderstand", "misunderstood",
+        "figure out", "figures out", "figured out", "figuring out"
+    ],
+    "coping": [
+        "deal with", "deals with", "dealing with", "dealt with",
+        "handle", "handles", "handled", "handling"
+    ]
+})
+
+# Requests for help with emotions, matched against the lowercased input
+_HELP_PATTERNS = (
+    re.compile(r"how to (deal with|handle|manage|understand).*(emotion|feeling)"),
+    re.compile(r"help me (deal with|handle|manage|understand)"),
+    re.compile(r"(control|regulate|manage).*(emotions|feelings)"),
+)
+
+# Literal text that every help pattern requires; checked first so that most
+# turns skip the regex searches entirely
+_HELP_TRIGGERS = ("how to", "help me", "control", "regulate", "manage")
+
+
+@lru_cache(maxsize=256)
+def _select_emotional_intelligence_tip(input_lower: str) -> str:
+    """Pick the emotional intelligence tip for a lowercased input (cached, as phrasings repeat)."""
+    if "anger" in input_lower or "angry" in input_lower:
+        return "Practice the STOP technique: Stop, Take a breath, Observe your anger without judgment, and Proceed mindfully. Anger is often a signal that a boundary has been crossed or a need isn't being met."
+    
+    if "sad" in input_lower or "depressed" in input_lower:
+        return "Allow yourself to feel sadness fully without judgment. Sadness often indicates loss or disappointment. Practice self-compassion and remember that emotions are temporary visitors, not permanent residents."
+    
+    if "anxiety" in input_lower or "worried" in input_lower or "fear" in input_lower:
+        return "Use the 5-4-3-2-1 grounding technique: Name 5 things you can see, 4 you can touch, 3 you can hear, 2 you can smell, and 1 you can taste. This brings you back to the present moment and reduces future-oriented worry."
+    
+    if "understand" in input_lower or "identify" in input_lower:
+        return "Practice emotional labeling by asking yourself: 'What am I feeling right now?' Be specific - instead of 'bad,' try 'disappointed,' 'frustrated,' or 'hurt.' Naming emotions accurately reduces their intensity."
+    
+    if "regulate" in input_lower or "control" in input_lower:
+        return "Remember that emotions aren't good or bad - they're information. Instead of trying to control emotions, practice responding to them wisely. The goal is emotional agility, not emotional suppression."
+    
+    if "empathy" in input_lower or "understand others" in input_lower:
+        return "Practice empathetic listening: Listen to understand, not to respond. Reflect back what you hear ('It sounds like you're feeling...') and validate their emotional experience, even if you don't agree with their perspective."
+    
+    return "Practice emotional awareness by checking in with yourself regularly: 'What am I feeling right now? Where do I feel it in my body? What might this emotion be telling me?'"
+
+
 class EmotionsExpert(BasePersona):
     """
     Emotions Expert specializing in emotional intelligence, empathy, and mood analysis.
@@ -23,6 +107,8 @@ class EmotionsExpert(BasePersona):
     Helps users navigate their emotional landscape with wisdom and compassion.
     """
     
+    __slots__ = ("_meta",)
+    
     def __init__(
         self,
         memory_service=None,
@@ -37,14 +123,15 @@ class EmotionsExpert(BasePersona):
             memory_service=memory_service,
             rag_service=rag_service
         )
+        self._meta = emotions_meta
     
     def get_system_prompt(self) -> str:
         """Get the system prompt for the emotions expert."""
-        return get_persona_metadata("emotions").system_prompt
+        return self._meta.system_prompt
     
     def get_expertise_areas(self) -> List[str]:
         """Get the emotions expert's expertise areas."""
-        return get_persona_metadata("emotions").expertise_areas
+        return self._meta.expertise_areas
     
     def preprocess_input(self, user_input: str, context: Dict[str, Any]) -> str:
         """
@@ -57,47 +144,13 @@ class EmotionsExpert(BasePersona):
         Returns:
             Preprocessed input with emotional analysis
         """
-        # Identify emotional content
-        emotional_indicators = []
-        
-        # Basic emotions mapping
-        emotion_keywords = {
-            "joy": ["happy", "excited", "joyful", "pleased", "delighted", "glad", "cheerful"],
-            "sadness": ["sad", "down", "depressed", "unhappy", "miserable", "blue", "gloomy"],
-            "anger": ["angry", "mad", "furious", "irritated", "annoyed", "frustrated", "upset"],
-            "fear": ["afraid", "scared", "fearful", "anxious", "worried", "nervous", "terrified"],
-            "surprise": ["surprised", "shocked", "amazed", "astonished", "stunned"],
-            "disgust": ["disgusted", "revolted", "repulsed", "sickened"],
-            "love": ["love", "affection", "caring", "attached", "fond"],
-            "shame": ["ashamed", "embarrassed", "humiliated", "guilty"]
-        }
-        
-        detected_emotions = []
-        for emotion, keywords in emotion_keywords.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                detected_emotions.append(emotion)
+        features = get_input_features(user_input, context)
         
-        # Check for emotional intensity
-        intensity_indicators = {
-            "high": ["very", "extremely", "incredibly", "overwhelmingly", "completely"],
-            "moderate": ["quite", "rather", "somewhat", "pretty"],
-            "low": ["a little", "slightly", "a bit", "kind of"]
-        }
+        detected_emotions = classify(features.lower, _EMOTION_KEYWORDS)
+        regulation_needs = classify_words(features, _REGULATION_NEEDS)
         
-        emotional_intensity = "moderate"  # default
-        for intensity, keywords in intensity_indicators.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                emotional_intensity = intensity
-                break
-        
-        # Check for emotional regulation needs
-        regulation_needs = []
-        if "control" in user_input.lower() or "manage" in user_input.lower():
-            regulation_needs.append("regulation")
-        if "understand" in user_input.lower() or "figure out" in user_input.lower():
-            regulation_needs.append("understanding")
-        if "deal with" in user_input.lower() or "handle" in user_input.lower():
-            regulation_needs.append("coping")
+        # The first matching intensity wins; moderate is the default
+        emotional_intensity = first_word_match(features, _INTENSITY_INDICATORS, "moderate")
         
         # Add emotional context to the input
         context_elements = []
@@ -129,48 +182,25 @@ class EmotionsExpert(BasePersona):
         original_input = context.get("original_input", "")
         
         # Check if user is asking for help with emotions
-        help_patterns = [
-            r"how to (deal with|handle|manage|understand).*(emotion|feeling)",
-            r"help me (deal with|handle|manage|understand)",
-            r"(control|regulate|manage).*(emotions|feelings)"
-        ]
-        
-        if any(re.search(pattern, original_input.lower()) for pattern in help_patterns):
+        input_lower = get_input_features(original_input, context).lower
+        if contains_any(input_lower, _HELP_TRIGGERS) and any(
+            pattern.search(input_lower) for pattern in _HELP_PATTERNS
+        ):
             # Add a practical emotional intelligence tip
-            tip = self._get_emotional_intelligence_tip(original_input)
+            tip = self._get_emotional_intelligence_tip(input_lower)
             if tip:
                 response = f"{response}\n\n💚 **Emotional Intelligence Tip:** {tip}"
         
         return response
     
-    def _get_emotional_intelligence_tip(self, user_input: str) -> str:
+    def _get_emotional_intelligence_tip(self, input_lower: str) -> str:
         """
         Generate a relevant emotional intelligence tip based on user input.
         
         Args:
-            user_input: The user's input
+            input_lower: The user's input, already lowercased
             
         Returns:
             Relevant emotional intelligence tip
         """
-        input_lower = user_input.lower()
-        
-        if "anger" in input_lower or "angry" in input_lower:
-            return "Practice the STOP technique: Stop, Take a breath, Observe your anger without judgment, and Proceed mindfully. Anger is often a signal that a boundary has been crossed or a need isn't being met."
-        
-        if "sad" in input_lower or "depressed" in input_lower:
-            return "Allow yourself to feel sadness fully without judgment. Sadness often indicates loss or disappointment. Practice self-compassion and remember that emotions are temporary visitors, not permanent residents."
-        
-        if "anxiety" in input_lower or "worried" in input_lower or "fear" in input_lower:
-            return "Use the 5-4-3-2-1 grounding technique: Name 5 things you can see, 4 you can touch, 3 you can hear, 2 you can smell, and 1 you can taste. This brings you back to the present moment and reduces future-oriented worry."
-        
-        if "understand" in input_lower or "identify" in input_lower:
-            return "Practice emotional labeling by asking yourself: 'What am I feeling right now?' Be specific - instead of 'bad,' try 'disappointed,' 'frustrated,' or 'hurt.' Naming emotions accurately reduces their intensity."
-        
-        if "regulate" in input_lower or "control" in input_lower:
-            return "Remember that emotions aren't good or bad - they're information. Instead of trying to control emotions, practice responding to them wisely. The goal is emotional agility, not emotional suppression."
-        
-        if "empathy" in input_lower or "understand others" in input_lower:
-            return "Practice empathetic listening: Listen to understand, not to respond. Reflect back what you hear ('It sounds like you're feeling...') and validate their emotional experience, even if you don't agree with their perspective."
-        
-        return "Practice emotional awareness by checking in with yourself regularly: 'What am I feeling right now? Where do I feel it in my body? What might this emotion be telling me?'"
\ No newline at end of file
+        return _select_emotional_intelligence_tip(input_lower)
@@ -8,6 +8,14 @@ import logging
 from typing import Dict, List, Optional, Any
 import re
 
+from ._routing import (
+    BucketClassifier,
+    first_match,
+    first_word_match,
+    get_input_features,
+    make_buckets,
+    make_word_buckets
+)
 from .base import BasePersona
 from .prompts import get_persona_metadata
 
@@ -15,6 +23,65 @@ from .prompts import get_persona_metadata
 logger = logging.getLogger(__name__)
 
 
+# Fear and anxiety keywords
+_FEAR_KEYWORDS = make_buckets({
+    "anxiety": ["anxious", "anxiety", "nervous", "worried", "uneasy", "restless"],
+    "fear": ["afraid", "scared", "fearful", "terrified", "panic", "phobia"],
+    "stress": ["stressed", "overwhelmed", "pressure", "tense", "strained"],
+    "doubt": ["doubt", "unsure", "uncertain", "insecure", "inadequate"],
+    "avoidance": ["avoid", "procrastinate", "put off", "escape", "run away"]
+})
+
+# Fear intensity, checked in order and matched as whole words ("very" must
+# not fire on "every")
+_INTENSITY_INDICATORS = make_word_buckets({
+    "high": ["very", "extremely", "overwhelmingly", "completely", "totally"],
+    "moderate": ["quite", "rather", "somewhat", "pretty"],
+    "low": ["a little", "slightly", "a bit", "kind of"]
+})
+
+# Fear contexts
+_FEAR_CONTEXTS = make_buckets({
+    "social": ["people", "social", "public", "speaking", "meeting", "group"],
+    "performance": ["performance", "test", "exam", "presentation", "interview"],
+    "health": ["health", "illness", "disease", "pain", "injury", "death"],
+    "financial": ["money", "financial", "job", "career", "debt", "future"],
+    "safety": ["safe", "danger", "harm", "threat", "security"],
+    "failure": ["fail", "failure", "mistake", "wrong", "embarrass", "judge"]
+})
+
+# Coping needs
+_COPING_NEEDS = make_buckets({
+    "support": ["help", "support"],
+    "management": ["manage", "handle"],
+    "confrontation": ["overcome", "face"],
+    "comfort": ["comfort", "reassurance"]
+})
+
+_CLASSIFIER = BucketClassifier(_FEAR_KEYWORDS, _FEAR_CONTEXTS, _COPING_NEEDS)
+
+# Requests for help with fears, matched against the lowercased input
+_HELP_PATTERNS = (
+    re.compile(r"how to (deal with|handle|manage|overcome).*(fear|anxiety|worry)"),
+    re.compile(r"help me (deal with|handle|manage|overcome)"),
+    re.compile(r"(reduce|calm|soothe).*(anxiety|fear|stress)"),
+)
+
+# Coping tips as (keywords, tip), checked in order; the first match wins
+_COPING_TIPS = (
+    (("anxiety", "panic"), "Use box breathing: Inhale for 4 counts, hold for 4, exhale for 4, hold for 4. Repeat 4 times. This activates your parasympathetic nervous system and quickly reduces anxiety symptoms."),
+    (("fear", "afraid"), "Practice exposure gradually: Start with thinking about the fear, then looking at pictures, then approaching it from a distance. Each small step builds confidence and reduces fear intensity."),
+    (("worry", "overthinking"), "Schedule 'worry time': Set aside 10-15 minutes daily to write down all your worries. When worries arise outside this time, remind yourself to save them for your scheduled worry session."),
+    (("social", "people"), "Prepare conversation starters and practice deep breathing before social events. Remember that most people are focused on themselves, not judging you. Start with small, low-pressure interactions."),
+    (("failure", "mistake"), "Reframe failure as feedback: Ask 'What can I learn from this?' instead of 'What did I do wrong?' Every expert was once a beginner who made mistakes. Growth requires experimentation."),
+    (("stress", "overwhelmed"), "Use the 5-4-3-2-1 grounding technique: Name 5 things you can see, 4 you can touch, 3 you can hear, 2 you can smell, and 1 you can taste. This brings you back to the present moment."),
+    (("confidence", "self-esteem"), "Keep a success journal: Write down 3 things you accomplished or handled well each day, no matter how small. This builds evidence of your competence and naturally boosts confidence."),
+)
+
+# Tip used when no rule matches
+_DEFAULT_COPING_TIP = "Remember that fear is a normal protective mechanism, not a character flaw. Your courage isn't the absence of fear, but taking action despite feeling afraid. Start small and celebrate each brave step."
+
+
 class FearsExpert(BasePersona):
     """
     Fears Expert specializing in anxiety management, risk assessment, and comfort building.
@@ -23,6 +90,8 @@ class FearsExpert(BasePersona):
     Provides gentle guidance and practical tools for managing anxiety.
     """
     
+    __slots__ = ("_meta",)
+    
     def __init__(
         self,
         memory_service=None,
@@ -37,14 +106,15 @@ class FearsExpert(BasePersona):
             memory_service=memory_service,
             rag_service=rag_service
         )
+        self._meta = fears_meta
     
     def get_system_prompt(self) -> str:
         """Get the system prompt for the fears expert."""
-        return get_persona_metadata("fears").system_prompt
+        return self._meta.system_prompt
     
     def get_expertise_areas(self) -> List[str]:
         """Get the fears expert's expertise areas."""
-        return get_persona_metadata("fears").expertise_areas
+        return self._meta.expertise_areas
     
     def preprocess_input(self, user_input: str, context: Dict[str, Any]) -> str:
         """
@@ -57,61 +127,13 @@ class FearsExpert(BasePersona):
         Returns:
             Preprocessed input with fear analysis
         """
-        # Identify fear and anxiety indicators
-        fear_indicators = []
-        
-        # Fear and anxiety keywords
-        fear_keywords = {
-            "anxiety": ["anxious", "anxiety", "nervous", "worried", "uneasy", "restless"],
-            "fear": ["afraid", "scared", "fearful", "terrified", "panic", "phobia"],
-            "stress": ["stressed", "overwhelmed", "pressure", "tense", "strained"],
-            "doubt": ["doubt", "unsure", "uncertain", "insecure", "inadequate"],
-            "avoidance": ["avoid", "procrastinate", "put off", "escape", "run away"]
-        }
-        
-        detected_fears = []
-        for fear_type, keywords in fear_keywords.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                detected_fears.append(fear_type)
+        features = get_input_features(user_input, context)
         
-        # Check for fear intensity
-        intensity_indicators = {
-            "high": ["very", "extremely", "overwhelmingly", "completely", "totally"],
-            "moderate": ["quite", "rather", "somewhat", "pretty"],
-            "low": ["a little", "slightly", "a bit", "kind of"]
-        }
+        # Fear types, contexts and coping needs in one pass
+        detected_fears, fear_contexts, coping_needs = _CLASSIFIER.classify(features.lower)
         
-        fear_intensity = "moderate"  # default
-        for intensity, keywords in intensity_indicators.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                fear_intensity = intensity
-                break
-        
-        # Check for fear context
-        fear_contexts = []
-        contexts = {
-            "social": ["people", "social", "public", "speaking", "meeting", "group"],
-            "performance": ["performance", "test", "exam", "presentation", "interview"],
-            "health": ["health", "illness", "disease", "pain", "injury", "death"],
-            "financial": ["money", "financial", "job", "career", "debt", "future"],
-            "safety": ["safe", "danger", "harm", "threat", "security"],
-            "failure": ["fail", "failure", "mistake", "wrong", "embarrass", "judge"]
-        }
-        
-        for context_type, keywords in contexts.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                fear_contexts.append(context_type)
-        
-        # Check for coping needs
-        coping_needs = []
-        if "help" in user_input.lower() or "support" in user_input.lower():
-            coping_needs.append("support")
-        if "manage" in user_input.lower() or "handle" in user_input.lower():
-            coping_needs.append("management")
-        if "overcome" in user_input.lower() or "face" in user_input.lower():
-            coping_needs.append("confrontation")
-        if "comfort" in user_input.lower() or "reassurance" in user_input.lower():
-            coping_needs.append("comfort")
+        # The first matching intensity wins; moderate is the default
+        fear_intensity = first_word_match(features, _INTENSITY_INDICATORS, "moderate")
         
         # Add fear context to the input
         context_elements = []
@@ -145,51 +167,23 @@ class FearsExpert(BasePersona):
         original_input = context.get("original_input", "")
         
         # Check if user is asking for help with fears
-        help_patterns = [
-            r"how to (deal with|handle|manage|overcome).*(fear|anxiety|worry)",
-            r"help me (deal with|handle|manage|overcome)",
-            r"(reduce|calm|soothe).*(anxiety|fear|stress)"
-        ]
-        
-        if any(re.search(pattern, original_input.lower()) for pattern in help_patterns):
+        input_lower = get_input_features(original_input, context).lower
+        if any(pattern.search(input_lower) for pattern in _HELP_PATTERNS):
             # Add a practical coping tip
-            tip = self._get_coping_tip(original_input)
+            tip = self._get_coping_tip(input_lower)
             if tip:
                 response = f"{response}\n\n🛡️ **Comfort & Coping Tip:** {tip}"
         
         return response
     
-    def _get_coping_tip(self, user_input: str) -> str:
+    def _get_coping_tip(self, input_lower: str) -> str:
         """
         Generate a relevant coping tip based on user input.
         
         Args:
-            user_input: The user's input
+            input_lower: The user's input, already lowercased
             
         Returns:
             Relevant coping tip
         """
-        input_lower = user_input.lower()
-        
-        if "anxiety" in input_lower or "panic" in input_lower:
-            return "Use box breathing: Inhale for 4 counts, hold for 4, exhale for 4, hold for 4. Repeat 4 times. This activates your parasympathetic nervous system and quickly reduces anxiety symptoms."
-        
-        if "fear" in input_lower or "afraid" in input_lower:
-            return "Practice exposure gradually: Start with thinking about the fear, then looking at pictures, then approaching it from a distance. Each small step builds confidence and reduces fear intensity."
-        
-        if "worry" in input_lower or "overthinking" in input_lower:
-            return "Schedule 'worry time': Set aside 10-15 minutes daily to write down all your worries. When worries arise outside this time, remind yourself to save them for your scheduled worry session."
-        
-        if "social" in input_lower or "people" in input_lower:
-            return "Prepare conversation starters and practice deep breathing before social events. Remember that most people are focused on themselves, not judging you. Start with small, low-pressure interactions."
-        
-        if "failure" in input_lower or "mistake" in input_lower:
-            return "Reframe failure as feedback: Ask 'What can I learn from this?' instead of 'What did I do wrong?' Every expert was once a beginner who made mistakes. Growth requires experimentation."
-        
-        if "stress" in input_lower or "overwhelmed" in input_lower:
-            return "Use the 5-4-3-2-1 grounding technique: Name 5 things you can see, 4 you can touch, 3 you can hear, 2 you can smell, and 1 you can taste. This brings you back to the present moment."
-        
-        if "confidence" in input_lower or "self-esteem" in input_lower:
-            return "Keep a success journal: Write down 3 things you accomplished or handled well each day, no matter how small. This builds evidence of your competence and naturally boosts confidence."
-        
-        return "Remember that fear is a normal protective mechanism, not a character flaw. Your courage isn't the absence of fear, but taking action despite feeling afraid. Start small and celebrate each brave step."
\ No newline at end of file
+        return first_match(input_lower, _COPING_TIPS, _DEFAULT_COPING_TIP)
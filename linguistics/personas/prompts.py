@@ -5,11 +5,19 @@ Centralizes all persona prompts, personalities, and routing keywords.
 Prompts are in English for Gemini compatibility with localized metadata.
 """
 
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Any
 from dataclasses import dataclass
+import sys
 
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10. PersonaMetadata has field
+# defaults, which rule out a hand-written __slots__, so older versions
+# keep the instance __dict__.
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PersonaMetadata:
     """Metadata for a persona including localized information."""
     name: str
@@ -21,10 +29,13 @@ class PersonaMetadata:
     localized_descriptions: Dict[str, str] = None
     
     def __post_init__(self):
+        # Frozen, so normalize fields through object.__setattr__.
+        # Keyword lookups lowercase the query once, so the stored keywords must be lowercase too
+        object.__setattr__(self, "routing_keywords", [keyword.lower() for keyword in self.routing_keywords])
         if self.localized_names is None:
-            self.localized_names = {}
+            object.__setattr__(self, "localized_names", {})
         if self.localized_descriptions is None:
-            self.localized_descriptions = {}
+            object.__setattr__(self, "localized_descriptions", {})
 
 
 # System Prompts for all personas
@@ -312,6 +323,28 @@ PERSONAS_METADATA: Dict[str, PersonaMetadata] = {
 }
 
 
+# Read-only views, built once; the metadata table is static
+_PERSONAS_VIEW: Mapping[str, PersonaMetadata] = MappingProxyType(PERSONAS_METADATA)
+
+_ROUTING_KEYWORDS: Mapping[str, List[str]] = MappingProxyType({
+    persona_id: meta.routing_keywords for persona_id, meta in PERSONAS_METADATA.items()
+})
+
+
+def _build_keyword_index() -> Dict[str, List[str]]:
+    """Map each routing keyword to the personas that list it, in persona order."""
+    index: Dict[str, List[str]] = {}
+    for persona_id, meta in PERSONAS_METADATA.items():
+        for keyword in meta.routing_keywords:
+            personas = index.setdefault(keyword, [])
+            if persona_id not in personas:
+                personas.append(persona_id)
+    return index
+
+
+_KEYWORD_INDEX = _build_keyword_index()
+
+
 def get_persona_metadata(persona_id: str) -> PersonaMetadata:
     """Get metadata for a specific persona."""
     if persona_id not in PERSONAS_METADATA:
@@ -319,23 +352,16 @@ def get_persona_metadata(persona_id: str) -> PersonaMetadata:
     return PERSONAS_METADATA[persona_id]
 
 
-def get_all_personas_metadata() -> Dict[str, PersonaMetadata]:
-    """Get metadata for all personas."""
-    return PERSONAS_METADATA.copy()
+def get_all_personas_metadata() -> Mapping[str, PersonaMetadata]:
+    """Get metadata for all personas (a shared, read-only view)."""
+    return _PERSONAS_VIEW
 
 
-def get_persona_routing_keywords() -> Dict[str, List[str]]:
-    """Get routing keywords for all personas."""
-    return {persona_id: meta.routing_keywords for persona_id, meta in PERSONAS_METADATA.items()}
+def get_persona_routing_keywords() -> Mapping[str, List[str]]:
+    """Get routing keywords for all personas (a shared, read-only view)."""
+    return _ROUTING_KEYWORDS
 
 
 def get_persona_by_keyword(keyword: str) -> List[str]:
     """Get list of persona IDs that match a given keyword."""
-    keyword_lower = keyword.lower()
-    matching_personas = []
-    
-    for persona_id, metadata in PERSONAS_METADATA.items():
-        if keyword_lower in metadata.routing_keywords:
-            matching_personas.append(persona_id)
-    
-    return matching_personas
\ No newline at end of file
+    return list(_KEYWORD_INDEX.get(keyword.lower(), ()))
\ No newline at end of file
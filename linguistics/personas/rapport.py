@@ -5,9 +5,10 @@ Specializes in relationship building, trust, and emotional connection.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Any
 import re
 
+from ._routing import BucketClassifier, first_match, get_input_features, make_buckets
 from .base import BasePersona
 from .prompts import get_persona_metadata
 
@@ -15,6 +16,46 @@ from .prompts import get_persona_metadata
 logger = logging.getLogger(__name__)
 
 
+# Relationship type indicators
+_RELATIONSHIP_TYPES = make_buckets({
+    "friend": ["friend", "friendship", "buddy", "pal"],
+    "romantic": ["partner", "relationship", "dating", "boyfriend", "girlfriend", "spouse", "husband", "wife"],
+    "family": ["family", "parent", "child", "sibling", "mother", "father", "brother", "sister"],
+    "work": ["coworker", "colleague", "boss", "manager", "team", "professional"],
+    "new": ["new", "just met", "stranger", "acquaintance"]
+})
+
+# Connection needs
+_CONNECTION_NEEDS = make_buckets({
+    "trust": ["trust", "distrust"],
+    "connection": ["connect", "connection"],
+    "closeness": ["close", "intimacy"],
+    "comfort": ["awkward", "uncomfortable"]
+})
+
+_CLASSIFIER = BucketClassifier(_RELATIONSHIP_TYPES, _CONNECTION_NEEDS)
+
+# Requests for help with relationships, matched against the lowercased input
+_HELP_PATTERNS = (
+    re.compile(r"how to (connect|build|improve).*(relationship|trust|rapport)"),
+    re.compile(r"help me (connect|build|improve)"),
+    re.compile(r"(build|create|establish).*(trust|connection|rapport)"),
+)
+
+# Rapport-building tips as (keywords, tip), checked in order; the first match wins
+_RAPPORT_TIPS = (
+    (("trust",), "Build trust through consistency: keep your promises, be reliable, and maintain confidentiality. Trust is built through small, consistent actions over time."),
+    (("new", "meet"), "Find common ground by asking open-ended questions about their interests, experiences, or opinions. Listen actively and show genuine curiosity about who they are."),
+    (("awkward", "uncomfortable"), "Break the tension with shared vulnerability or humor. Acknowledge the discomfort lightly ('Well, this is a bit awkward, but...') and focus on finding common interests."),
+    (("deep", "meaningful"), "Move beyond small talk by asking about values, dreams, or challenges. Share something authentic about yourself to create space for deeper connection."),
+    (("work", "professional"), "Build professional rapport by showing competence, reliability, and respect for others' time and expertise. Offer help and acknowledge others' contributions genuinely."),
+    (("conflict", "disagreement"), "Maintain connection during disagreements by focusing on understanding rather than winning. Validate their perspective even when you disagree: 'I can see why you feel that way...'"),
+)
+
+# Tip used when no rule matches
+_DEFAULT_RAPPORT_TIP = "Create rapport by mirroring their communication style and energy level, finding common interests, and showing genuine appreciation for who they are."
+
+
 class RapportExpert(BasePersona):
     """
     Rapport Expert specializing in relationship building, trust, and emotional connection.
@@ -23,6 +64,8 @@ class RapportExpert(BasePersona):
     Helps users build stronger, more meaningful relationships.
     """
     
+    __slots__ = ("_meta",)
+    
     def __init__(
         self,
         memory_service=None,
@@ -37,14 +80,15 @@ class RapportExpert(BasePersona):
             memory_service=memory_service,
             rag_service=rag_service
         )
+        self._meta = rapport_meta
     
     def get_system_prompt(self) -> str:
         """Get the system prompt for the rapport expert."""
-        return get_persona_metadata("rapport").system_prompt
+        return self._meta.system_prompt
     
     def get_expertise_areas(self) -> List[str]:
         """Get the rapport expert's expertise areas."""
-        return get_persona_metadata("rapport").expertise_areas
+        return self._meta.expertise_areas
     
     def preprocess_input(self, user_input: str, context: Dict[str, Any]) -> str:
         """
@@ -57,32 +101,10 @@ class RapportExpert(BasePersona):
         Returns:
             Preprocessed input with rapport analysis
         """
-        # Identify relationship context
-        relationship_indicators = []
-        
-        # Check for relationship type indicators
-        relationship_types = {
-            "friend": ["friend", "friendship", "buddy", "pal"],
-            "romantic": ["partner", "relationship", "dating", "boyfriend", "girlfriend", "spouse", "husband", "wife"],
-            "family": ["family", "parent", "child", "sibling", "mother", "father", "brother", "sister"],
-            "work": ["coworker", "colleague", "boss", "manager", "team", "professional"],
-            "new": ["new", "just met", "stranger", "acquaintance"]
-        }
+        input_lower = get_input_features(user_input, context).lower
         
-        for rel_type, keywords in relationship_types.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                relationship_indicators.append(rel_type)
-        
-        # Check for connection needs
-        connection_needs = []
-        if "trust" in user_input.lower() or "distrust" in user_input.lower():
-            connection_needs.append("trust")
-        if "connect" in user_input.lower() or "connection" in user_input.lower():
-            connection_needs.append("connection")
-        if "close" in user_input.lower() or "intimacy" in user_input.lower():
-            connection_needs.append("closeness")
-        if "awkward" in user_input.lower() or "uncomfortable" in user_input.lower():
-            connection_needs.append("comfort")
+        # Relationship types and connection needs in one pass
+        relationship_indicators, connection_needs = _CLASSIFIER.classify(input_lower)
         
         # Add rapport context to the input
         context_elements = []
@@ -112,48 +134,23 @@ class RapportExpert(BasePersona):
         original_input = context.get("original_input", "")
         
         # Check if user is asking for help with relationships
-        help_patterns = [
-            r"how to (connect|build|improve).*(relationship|trust|rapport)",
-            r"help me (connect|build|improve)",
-            r"(build|create|establish).*(trust|connection|rapport)"
-        ]
-        
-        if any(re.search(pattern, original_input.lower()) for pattern in help_patterns):
+        input_lower = get_input_features(original_input, context).lower
+        if any(pattern.search(input_lower) for pattern in _HELP_PATTERNS):
             # Add a practical rapport-building tip
-            tip = self._get_rapport_tip(original_input)
+            tip = self._get_rapport_tip(input_lower)
             if tip:
                 response = f"{response}\n\n🤝 **Rapport-Building Tip:** {tip}"
         
         return response
     
-    def _get_rapport_tip(self, user_input: str) -> str:
+    def _get_rapport_tip(self, input_lower: str) -> str:
         """
         Generate a relevant rapport-building tip based on user input.
         
         Args:
-            user_input: The user's input
+            input_lower: The user's input, already lowercased
             
         Returns:
             Relevant rapport-building tip
         """
-        input_lower = user_input.lower()
-        
-        if "trust" in input_lower:
-            return "Build trust through consistency: keep your promises, be reliable, and maintain confidentiality. Trust is built through small, consistent actions over time."
-        
-        if "new" in input_lower or "meet" in input_lower:
-            return "Find common ground by asking open-ended questions about their interests, experiences, or opinions. Listen actively and show genuine curiosity about who they are."
-        
-        if "awkward" in input_lower or "uncomfortable" in input_lower:
-            return "Break the tension with shared vulnerability or humor. Acknowledge the discomfort lightly ('Well, this is a bit awkward, but...') and focus on finding common interests."
-        
-        if "deep" in input_lower or "meaningful" in input_lower:
-            return "Move beyond small talk by asking about values, dreams, or challenges. Share something authentic about yourself to create space for deeper connection."
-        
-        if "work" in input_lower or "professional" in input_lower:
-            return "Build professional rapport by showing competence, reliability, and respect for others' time and expertise. Offer help and acknowledge others' contributions genuinely."
-        
-        if "conflict" in input_lower or "disagreement" in input_lower:
-            return "Maintain connection during disagreements by focusing on understanding rather than winning. Validate their perspective even when you disagree: 'I can see why you feel that way...'"
-        
-        return "Create rapport by mirroring their communication style and energy level, finding common interests, and showing genuine appreciation for who they are."
\ No newline at end of file
+        return first_match(input_lower, _RAPPORT_TIPS, _DEFAULT_RAPPORT_TIP)
@@ -5,9 +5,18 @@ Specializes in planning, decision-making, and systematic thinking.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Any
 import re
 
+from ._routing import (
+    BucketClassifier,
+    classify_words,
+    first_match,
+    first_word_match,
+    get_input_features,
+    make_buckets,
+    make_word_buckets
+)
 from .base import BasePersona
 from .prompts import get_persona_metadata
 
@@ -15,6 +24,62 @@ from .prompts import get_persona_metadata
 logger = logging.getLogger(__name__)
 
 
+# Strategic process needs
+_STRATEGIC_NEEDS = make_buckets({
+    "planning": ["plan", "planning", "schedule", "timeline", "roadmap"],
+    "decision_making": ["decide", "decision", "choose", "select", "option"],
+    "analysis": ["analyze", "analysis", "evaluate", "assess", "review"],
+    "goal_setting": ["goal", "objective", "target", "aim", "outcome"],
+    "risk_management": ["risk", "mitigate", "contingency", "backup", "prepare"],
+    "optimization": ["optimize", "improve", "enhance", "streamline", "efficiency"]
+})
+
+# Time horizons, checked in order and matched as whole words ("now" must not
+# fire on "know", nor "year" on "years"), so inflected forms are listed explicitly
+_TIME_HORIZONS = make_word_buckets({
+    "short_term": ["now", "today", "week", "weeks", "immediate", "immediately", "urgent", "urgently"],
+    "medium_term": ["month", "months", "quarter", "year"],
+    "long_term": ["years", "future", "long-term", "strategic", "strategically", "vision"]
+})
+
+# Complexity
+_COMPLEXITY_LEVELS = make_buckets({
+    "high": ["complex", "complicated"],
+    "low": ["simple", "straightforward"],
+    "multiple_factors": ["multiple", "many"]
+})
+
+# Stakeholder context, matched as whole words ("my" must not fire on "army"
+# or "empty"), so plural and reflexive forms are listed explicitly
+_STAKEHOLDERS = make_word_buckets({
+    "team": ["team", "teams", "group", "groups"],
+    "business": ["business", "businesses", "company", "companies"],
+    "personal": ["personal", "my", "myself"]
+})
+
+_CLASSIFIER = BucketClassifier(_STRATEGIC_NEEDS, _COMPLEXITY_LEVELS)
+
+# Requests for strategic help, matched against the lowercased input
+_HELP_PATTERNS = (
+    re.compile(r"how to (plan|strategize|decide)"),
+    re.compile(r"help me (plan|strategize|decide)"),
+    re.compile(r"(create|develop|make).*(plan|strategy)"),
+)
+
+# Strategy tips as (keywords, tip), checked in order; the first match wins
+_STRATEGY_TIPS = (
+    (("plan", "planning"), "Use the SMART framework: Make goals Specific, Measurable, Achievable, Relevant, and Time-bound. Break large plans into smaller milestones with clear success criteria."),
+    (("decide", "decision"), "Apply the 10/10/10 rule: How will you feel about this decision in 10 minutes, 10 months, and 10 years? This helps balance short-term emotions with long-term consequences."),
+    (("risk", "uncertainty"), "Use a decision matrix: List your options as rows and key criteria as columns. Weight each criterion by importance and score each option. This transforms complex decisions into clear analysis."),
+    (("goal", "objective"), "Work backwards from your desired outcome. Start with your end goal and identify the major milestones needed to get there. Then break each milestone into actionable steps."),
+    (("complex", "complicated"), "Use systems thinking: Identify the key components, their relationships, and feedback loops. Map out cause and effect before taking action. Often the best leverage points aren't the most obvious ones."),
+    (("prioritize", "focus"), "Apply the Eisenhower Matrix: Categorize tasks by urgency and importance. Focus on important-but-not-urgent tasks first, as these drive long-term success."),
+)
+
+# Tip used when no rule matches
+_DEFAULT_STRATEGY_TIP = "Think in scenarios: Consider best-case, worst-case, and most likely outcomes. This helps you prepare for uncertainty while making more robust decisions."
+
+
 class StrategyExpert(BasePersona):
     """
     Strategy Expert specializing in planning, decision-making, and systematic thinking.
@@ -23,6 +88,8 @@ class StrategyExpert(BasePersona):
     Helps users create clear paths forward and make well-reasoned decisions.
     """
     
+    __slots__ = ("_meta",)
+    
     def __init__(
         self,
         memory_service=None,
@@ -37,14 +104,15 @@ class StrategyExpert(BasePersona):
             memory_service=memory_service,
             rag_service=rag_service
         )
+        self._meta = strategy_meta
     
     def get_system_prompt(self) -> str:
         """Get the system prompt for the strategy expert."""
-        return get_persona_metadata("strategy").system_prompt
+        return self._meta.system_prompt
     
     def get_expertise_areas(self) -> List[str]:
         """Get the strategy expert's expertise areas."""
-        return get_persona_metadata("strategy").expertise_areas
+        return self._meta.expertise_areas
     
     def preprocess_input(self, user_input: str, context: Dict[str, Any]) -> str:
         """
@@ -57,53 +125,15 @@ class StrategyExpert(BasePersona):
         Returns:
             Preprocessed input with strategic analysis
         """
-        # Identify strategic context
-        strategic_indicators = []
-        
-        # Check for strategic process needs
-        strategic_needs = {
-            "planning": ["plan", "planning", "schedule", "timeline", "roadmap"],
-            "decision_making": ["decide", "decision", "choose", "select", "option"],
-            "analysis": ["analyze", "analysis", "evaluate", "assess", "review"],
-            "goal_setting": ["goal", "objective", "target", "aim", "outcome"],
-            "risk_management": ["risk", "mitigate", "contingency", "backup", "prepare"],
-            "optimization": ["optimize", "improve", "enhance", "streamline", "efficiency"]
-        }
+        features = get_input_features(user_input, context)
         
-        for need_type, keywords in strategic_needs.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                strategic_indicators.append(need_type)
+        # Strategic needs and complexity in one pass
+        strategic_indicators, complexity_indicators = _CLASSIFIER.classify(features.lower)
         
-        # Check for time horizon
-        time_horizons = {
-            "short_term": ["now", "today", "week", "immediate", "urgent"],
-            "medium_term": ["month", "quarter", "6 months", "year"],
-            "long_term": ["years", "future", "long-term", "strategic", "vision"]
-        }
-        
-        time_horizon = "medium_term"  # default
-        for horizon, keywords in time_horizons.items():
-            if any(keyword in user_input.lower() for keyword in keywords):
-                time_horizon = horizon
-                break
-        
-        # Check for complexity
-        complexity_indicators = []
-        if "complex" in user_input.lower() or "complicated" in user_input.lower():
-            complexity_indicators.append("high")
-        if "simple" in user_input.lower() or "straightforward" in user_input.lower():
-            complexity_indicators.append("low")
-        if "multiple" in user_input.lower() or "many" in user_input.lower():
-            complexity_indicators.append("multiple_factors")
-        
-        # Check for stakeholder context
-        stakeholder_indicators = []
-        if "team" in user_input.lower() or "group" in user_input.lower():
-            stakeholder_indicators.append("team")
-        if "business" in user_input.lower() or "company" in user_input.lower():
-            stakeholder_indicators.append("business")
-        if "personal" in user_input.lower() or "my" in user_input.lower():
-            stakeholder_indicators.append("personal")
+        # Time horizon and stakeholders are looked up in the token set;
+        # the first matching time horizon wins
+        time_horizon = first_word_match(features, _TIME_HORIZONS, "medium_term")
+        stakeholder_indicators = classify_words(features, _STAKEHOLDERS)
         
         # Add strategic context to the input
         context_elements = []
@@ -137,48 +167,23 @@ class StrategyExpert(BasePersona):
         original_input = context.get("original_input", "")
         
         # Check if user is asking for strategic help
-        help_patterns = [
-            r"how to (plan|strategize|decide)",
-            r"help me (plan|strategize|decide)",
-            r"(create|develop|make).*(plan|strategy)"
-        ]
-        
-        if any(re.search(pattern, original_input.lower()) for pattern in help_patterns):
+        input_lower = get_input_features(original_input, context).lower
+        if any(pattern.search(input_lower) for pattern in _HELP_PATTERNS):
             # Add a practical strategic tip
-            tip = self._get_strategy_tip(original_input)
+            tip = self._get_strategy_tip(input_lower)
             if tip:
                 response = f"{response}\n\n🎯 **Strategy Tip:** {tip}"
         
         return response
     
-    def _get_strategy_tip(self, user_input: str) -> str:
+    def _get_strategy_tip(self, input_lower: str) -> str:
         """
         Generate a relevant strategy tip based on user input.
         
         Args:
-            user_input: The user's input
+            input_lower: The user's input, already lowercased
             
         Returns:
             Relevant strategy tip
         """
-        input_lower = user_input.lower()
-        
-        if "plan" in input_lower or "planning" in input_lower:
-            return "Use the SMART framework: Make goals Specific, Measurable, Achievable, Relevant, and Time-bound. Break large plans into smaller milestones with clear success criteria."
-        
-        if "decide" in input_lower or "decision" in input_lower:
-            return "Apply the 10/10/10 rule: How will you feel about this decision in 10 minutes, 10 months, and 10 years? This helps balance short-term emotions with long-term consequences."
-        
-        if "risk" in input_lower or "uncertainty" in input_lower:
-            return "Use a decision matrix: List your options as rows and key criteria as columns. Weight each criterion by importance and score each option. This transforms complex decisions into clear analysis."
-        
-        if "goal" in input_lower or "objective" in input_lower:
-            return "Work backwards from your desired outcome. Start with your end goal and identify the major milestones needed to get there. Then break each milestone into actionable steps."
-        
-        if "complex" in input_lower or "complicated" in input_lower:
-            return "Use systems thinking: Identify the key components, their relationships, and feedback loops. Map out cause and effect before taking action. Often the best leverage points aren't the most obvious ones."
-        
-        if "prioritize" in input_lower or "focus" in input_lower:
-            return "Apply the Eisenhower Matrix: Categorize tasks by urgency and importance. Focus on important-but-not-urgent tasks first, as these drive long-term success."
-        
-        return "Think in scenarios: Consider best-case, worst-case, and most likely outcomes. This helps you prepare for uncertainty while making more robust decisions."
\ No newline at end of file
+        return first_match(input_lower, _STRATEGY_TIPS, _DEFAULT_STRATEGY_TIP)
@@ -4,10 +4,9 @@ RAG (Retrieval-Augmented Generation) module for linguistics package.
 Provides retrieval capabilities to enhance AI responses with relevant
 context from stored knowledge bases and documents.
 """
+
 from .rag_service import RAGService
 
-__all__ = ["RAGService"]
-=======
 # Skip retriever import for setup script to avoid dependency issues
 try:
     from .retriever import (
@@ -22,11 +21,11 @@ except ImportError:
     get_rag_retriever = None
     reset_rag_retriever = None
 
-__all__ = []
+__all__ = ["RAGService"]
 
 if _retriever_available:
     __all__.extend([
         "RAGRetriever",
         "get_rag_retriever",
         "reset_rag_retriever",
-    ])
\ No newline at end of file
+    ])
@@ -8,8 +8,11 @@ and heading level information.
 
 import hashlib
 import logging
+import os
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Generator, List, Optional, Tuple, Union
 
@@ -17,11 +20,58 @@ import tiktoken
 
 logger = logging.getLogger(__name__)
 
+# Token counts remembered per chunker; longer texts are keyed by a digest
+# so the cache does not pin whole chapters in memory.
+_TOKEN_CACHE_SIZE = 8192
+_TOKEN_CACHE_DIGEST_CHARS = 256
+
+# Token windows decoded per batch when chunking by tokens alone
+_DECODE_BATCH_SIZE = 64
+
+# Regex patterns for markdown parsing
+_HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+_SECTION_PATTERN = re.compile(r'^:::\s*(\w+)', re.MULTILINE)
+_SEPARATOR_PATTERN = re.compile(r'^-{4,}$', re.MULTILINE)
+
+# The three line types above in one pattern, tried once per line
+_LINE_PATTERN = re.compile(
+    r'^(?:(?P<separator>-{4,})$'
+    r'|(?P<hashes>#{1,6})\s+(?P<title>.+)$'
+    r'|:::\s*(?P<section>\w+))'
+)
+
+# Metadata shared by every chunk; the per-chunk fields are placeholders
+# that keep the key order stable
+_BASE_METADATA: Dict[str, Union[str, int, List[str]]] = {
+    "chunk_type": "content",
+    "position": 0,
+    "heading_level": 0,
+    "language": "ru",  # Book appears to be in Russian
+    "content_type": "lesson",
+    "difficulty_level": "intermediate",
+    "topic": "linguistics"
+}
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process."""
+    return tiktoken.get_encoding(encoding_name)
+
+
+@lru_cache(maxsize=1024)
+def _make_tag(name: str) -> str:
+    """Turn a chapter or section name into a tag (cached, as chunks repeat them)."""
+    return name.lower().replace(" ", "_")
+
 
 @dataclass
 class Chunk:
     """Represents a chunk of text with metadata."""
     
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ("id", "content", "metadata", "token_count")
+    
     id: str
     content: str
     metadata: Dict[str, Union[str, int, List[str]]]
@@ -41,6 +91,16 @@ class Chunk:
 class ChunkingStats:
     """Statistics for chunking operations."""
     
+    __slots__ = (
+        "total_chunks",
+        "total_tokens",
+        "avg_tokens_per_chunk",
+        "min_tokens",
+        "max_tokens",
+        "chapters_found",
+        "sections_found",
+    )
+    
     total_chunks: int
     total_tokens: int
     avg_tokens_per_chunk: float
@@ -58,6 +118,12 @@ class BookChunker:
     Generates deterministic IDs based on content hash and position.
     """
     
+    # Regex patterns for markdown parsing, shared by all instances
+    heading_pattern = _HEADING_PATTERN
+    section_pattern = _SECTION_PATTERN
+    separator_pattern = _SEPARATOR_PATTERN
+    line_pattern = _LINE_PATTERN
+    
     def __init__(
         self,
         max_tokens: int = 512,
@@ -73,25 +139,92 @@ class BookChunker:
             min_tokens: Minimum tokens per chunk (smaller chunks will be merged)
             overlap_tokens: Number of tokens to overlap between chunks
             encoding_name: Name of the tiktoken encoding to use
+        
+        Raises:
+            ValueError: If max_tokens is smaller than min_tokens
         """
+        if max_tokens < min_tokens:
+            raise ValueError(
+                f"max_tokens ({max_tokens}) cannot be smaller than min_tokens ({min_tokens})"
+            )
+        
         self.max_tokens = max_tokens
         self.min_tokens = min_tokens
         self.overlap_tokens = overlap_tokens
         
         try:
-            self.encoding = tiktoken.get_encoding(encoding_name)
+            self.encoding = _get_encoding(encoding_name)
         except KeyError:
             logger.warning(f"Encoding {encoding_name} not found, falling back to cl100k_base")
-            self.encoding = tiktoken.get_encoding("cl100k_base")
+            self.encoding = _get_encoding("cl100k_base")
         
-        # Regex patterns for markdown parsing
-        self.heading_pattern = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
-        self.section_pattern = re.compile(r'^:::\s*(\w+)', re.MULTILINE)
-        self.separator_pattern = re.compile(r'^-{4,}$', re.MULTILINE)
+        # Least recently used first
+        self._token_counts: "OrderedDict[Union[str, bytes], int]" = OrderedDict()
         
     def count_tokens(self, text: str) -> int:
         """Count tokens in text using the configured encoding."""
-        return len(self.encoding.encode(text))
+        key = self._token_cache_key(text)
+        token_counts = self._token_counts
+        count = token_counts.get(key)
+        if count is not None:
+            token_counts.move_to_end(key)
+            return count
+        
+        count = len(self.encoding.encode(text))
+        self._remember_token_count(key, count)
+        return count
+    
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for many texts at once.
+        
+        Texts missing from the cache are encoded in a single
+        ``encode_batch`` call, which tiktoken spreads over its own threads.
+        
+        Args:
+            texts: Texts to count
+            
+        Returns:
+            Token counts in the order of texts
+        """
+        keys = [self._token_cache_key(text) for text in texts]
+        token_counts = self._token_counts
+        
+        # Cache misses keep a 0 placeholder until the batch fills them in
+        counts: List[int] = []
+        missing: List[int] = []
+        for i, key in enumerate(keys):
+            count = token_counts.get(key)
+            if count is None:
+                missing.append(i)
+                count = 0
+            counts.append(count)
+        
+        if missing:
+            encoded = self.encoding.encode_batch(
+                [texts[i] for i in missing],
+                num_threads=os.cpu_count() or 1
+            )
+            for i, tokens in zip(missing, encoded):
+                count = len(tokens)
+                counts[i] = count
+                self._remember_token_count(keys[i], count)
+        
+        return counts
+    
+    @staticmethod
+    def _token_cache_key(text: str) -> Union[str, bytes]:
+        """Key for the token count cache."""
+        if len(text) > _TOKEN_CACHE_DIGEST_CHARS:
+            return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        return text
+    
+    def _remember_token_count(self, key: Union[str, bytes], count: int) -> None:
+        """Store a token count, evicting the least recently used one if full."""
+        token_counts = self._token_counts
+        token_counts[key] = count
+        if len(token_counts) > _TOKEN_CACHE_SIZE:
+            token_counts.popitem(last=False)
     
     def generate_chunk_id(self, content: str, position: int, chapter: Optional[str] = None) -> str:
         """
@@ -105,12 +238,14 @@ class BookChunker:
         Returns:
             Deterministic chunk ID
         """
-        # Create a hash of content + position + optional chapter
-        hash_input = f"{content}_{position}"
+        # Hash content + position + optional chapter, fed piecewise so the
+        # content is not copied into a joined string first
+        hasher = hashlib.sha256(content.encode('utf-8'))
+        hasher.update(f"_{position}".encode('utf-8'))
         if chapter:
-            hash_input += f"_{chapter}"
+            hasher.update(f"_{chapter}".encode('utf-8'))
         
-        content_hash = hashlib.sha256(hash_input.encode('utf-8')).hexdigest()[:12]
+        content_hash = hasher.hexdigest()[:12]
         return f"chunk_{content_hash}_{position}"
     
     def parse_markdown_structure(self, content: str) -> List[Dict]:
@@ -121,83 +256,88 @@ class BookChunker:
             List of dictionaries representing the document structure
         """
         lines = content.split('\n')
+        # A trailing blank line closes the last paragraph
+        lines.append('')
         structure = []
         current_chapter = None
         current_section = None
         current_level = 0
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        # First line of the open paragraph (-1 if none); its lines are
+        # joined straight from a slice of lines when it closes
+        paragraph_start = -1
+        
+        for i, raw_line in enumerate(lines):
+            # Blank lines close the open paragraph; isspace() tests for
+            # them without allocating a stripped copy
+            if not raw_line or raw_line.isspace():
+                if paragraph_start >= 0:
+                    paragraph_content = '\n'.join(lines[paragraph_start:i])
+                    structure.append({
+                        'type': 'paragraph',
+                        'content': paragraph_content,
+                        'chapter': current_chapter,
+                        'section': current_section,
+                        'level': current_level,
+                        'line_start': paragraph_start,
+                        'line_end': i - 1
+                    })
+                    paragraph_start = -1
+                continue
             
-            # Skip empty lines and separators
-            if not line or self.separator_pattern.match(line):
-                i += 1
+            # Consecutive non-empty lines belong to the open paragraph
+            if paragraph_start >= 0:
                 continue
             
-            # Check for headings
-            heading_match = self.heading_pattern.match(line)
-            if heading_match:
-                level = len(heading_match.group(1))
-                title = heading_match.group(2).strip()
+            line = raw_line.strip()
+            
+            line_match = _LINE_PATTERN.match(line)
+            if line_match is not None:
+                line_type = line_match.lastgroup
                 
-                if level <= 2:  # Chapter level
-                    current_chapter = title
-                    current_section = None
-                    current_level = level
-                else:  # Section level
-                    current_section = title
-                    current_level = level
+                # Skip separators
+                if line_type == 'separator':
+                    continue
                 
-                structure.append({
-                    'type': 'heading',
-                    'level': level,
-                    'title': title,
-                    'chapter': current_chapter,
-                    'section': current_section,
-                    'line_start': i,
-                    'line_end': i
-                })
-                i += 1
-                continue
-            
-            # Check for section markers
-            section_match = self.section_pattern.match(line)
-            if section_match:
-                current_section = section_match.group(1)
-                structure.append({
-                    'type': 'section',
-                    'name': current_section,
-                    'chapter': current_chapter,
-                    'section': current_section,
-                    'line_start': i,
-                    'line_end': i
-                })
-                i += 1
-                continue
+                # Check for headings
+                if line_type == 'title':
+                    level = len(line_match.group('hashes'))
+                    title = line_match.group('title').strip()
+                    
+                    if level <= 2:  # Chapter level
+                        current_chapter = title
+                        current_section = None
+                        current_level = level
+                    else:  # Section level
+                        current_section = title
+                        current_level = level
+                    
+                    structure.append({
+                        'type': 'heading',
+                        'level': level,
+                        'title': title,
+                        'chapter': current_chapter,
+                        'section': current_section,
+                        'line_start': i,
+                        'line_end': i
+                    })
+                    continue
+                
+                # Check for section markers
+                if line_type == 'section':
+                    current_section = line_match.group('section')
+                    structure.append({
+                        'type': 'section',
+                        'name': current_section,
+                        'chapter': current_chapter,
+                        'section': current_section,
+                        'line_start': i,
+                        'line_end': i
+                    })
+                    continue
             
             # Regular content paragraph
-            paragraph_lines = []
             paragraph_start = i
-            
-            # Collect consecutive non-empty lines as a paragraph
-            while i < len(lines) and lines[i].strip():
-                paragraph_lines.append(lines[i])
-                i += 1
-            
-            if paragraph_lines:
-                paragraph_content = '\n'.join(paragraph_lines)
-                structure.append({
-                    'type': 'paragraph',
-                    'content': paragraph_content,
-                    'chapter': current_chapter,
-                    'section': current_section,
-                    'level': current_level,
-                    'line_start': paragraph_start,
-                    'line_end': i - 1
-                })
-            
-            i += 1
         
         return structure
     
@@ -222,26 +362,25 @@ class BookChunker:
         Returns:
             Metadata dictionary
         """
-        metadata = {
-            "chunk_type": chunk_type,
-            "position": position,
-            "heading_level": level,
-            "language": "ru",  # Book appears to be in Russian
-            "content_type": "lesson",
-            "difficulty_level": "intermediate",
-            "topic": "linguistics"
-        }
+        metadata = _BASE_METADATA.copy()
+        metadata["chunk_type"] = chunk_type
+        metadata["position"] = position
+        metadata["heading_level"] = level
+        
+        # Extended through this local; metadata values are typed as a union
+        tags: Optional[List[str]] = None
         
         if chapter:
             metadata["chapter"] = chapter
-            metadata["tags"] = [chapter.lower().replace(" ", "_")]
+            tags = [_make_tag(chapter)]
+            metadata["tags"] = tags
         
         if section:
             metadata["section"] = section
-            if "tags" in metadata:
-                metadata["tags"].append(section.lower().replace(" ", "_"))
+            if tags is not None:
+                tags.append(_make_tag(section))
             else:
-                metadata["tags"] = [section.lower().replace(" ", "_")]
+                metadata["tags"] = [_make_tag(section)]
         
         return metadata
     
@@ -273,13 +412,19 @@ class BookChunker:
         structure = self.parse_markdown_structure(content)
         position = 0
         
-        current_chunk_content = []
+        element_contents = [element.get('content', element.get('title', '')) for element in structure]
+        element_token_counts = self.count_tokens_batch(element_contents)
+        
+        # (content, token count) pairs of the chunk being built
+        current_chunk_content: List[Tuple[str, int]] = []
         current_metadata = None
         current_tokens = 0
+        max_tokens = self.max_tokens
         
-        for element in structure:
-            element_content = element.get('content', element.get('title', ''))
-            element_tokens = self.count_tokens(element_content)
+        for element, element_content, element_tokens in zip(structure, element_contents, element_token_counts):
+            chapter = element.get('chapter')
+            section = element.get('section')
+            level = element.get('level', 0)
             
             # Handle headings separately
             if element['type'] == 'heading':
@@ -295,15 +440,15 @@ class BookChunker:
                 
                 # Create heading chunk
                 heading_metadata = self.create_chunk_metadata(
-                    chapter=element.get('chapter'),
-                    section=element.get('section'),
-                    level=element['level'],
+                    chapter=chapter,
+                    section=section,
+                    level=level,
                     position=position,
                     chunk_type="heading"
                 )
                 
                 heading_chunk = Chunk(
-                    id=self.generate_chunk_id(element_content, position, element.get('chapter')),
+                    id=self.generate_chunk_id(element_content, position, chapter),
                     content=element_content,
                     metadata=heading_metadata,
                     token_count=element_tokens
@@ -314,16 +459,16 @@ class BookChunker:
                 # Reset buffer
                 current_chunk_content = []
                 current_metadata = self.create_chunk_metadata(
-                    chapter=element.get('chapter'),
-                    section=element.get('section'),
-                    level=element['level'],
+                    chapter=chapter,
+                    section=section,
+                    level=level,
                     position=position
                 )
                 current_tokens = 0
                 continue
             
             # Add content to current chunk
-            if current_tokens + element_tokens > self.max_tokens:
+            if current_tokens + element_tokens > max_tokens:
                 # Current chunk is full, yield it
                 if current_chunk_content:
                     yield self._create_chunk_from_buffer(
@@ -336,23 +481,21 @@ class BookChunker:
                 
                 # Start new chunk with overlap if needed
                 if self.overlap_tokens > 0 and current_chunk_content:
-                    overlap_content = self._create_overlap_content(current_chunk_content)
-                    current_chunk_content = overlap_content
-                    current_tokens = sum(self.count_tokens(c) for c in overlap_content)
+                    current_chunk_content, current_tokens = self._create_overlap_content(current_chunk_content)
                 else:
                     current_chunk_content = []
                     current_tokens = 0
                 
                 # Update metadata for new chunk
                 current_metadata = self.create_chunk_metadata(
-                    chapter=element.get('chapter'),
-                    section=element.get('section'),
-                    level=element.get('level', 0),
+                    chapter=chapter,
+                    section=section,
+                    level=level,
                     position=position
                 )
             
             # Add element to current chunk
-            current_chunk_content.append(element_content)
+            current_chunk_content.append((element_content, element_tokens))
             current_tokens += element_tokens
         
         # Yield final chunk
@@ -367,21 +510,46 @@ class BookChunker:
     def _chunk_by_tokens(self, content: str) -> Generator[Chunk, None, None]:
         """Chunk content by tokens only, ignoring structure."""
         tokens = self.encoding.encode(content)
-        position = 0
+        total_tokens = len(tokens)
+        
+        # Consecutive windows share overlap_tokens tokens
+        stride = max(self.max_tokens - self.overlap_tokens, 1)
         
-        i = 0
-        while i < len(tokens):
+        windows: List[List[int]] = []
+        position = 0
+        for start_idx in range(0, total_tokens, stride):
             # Calculate chunk boundaries
-            end_idx = min(i + self.max_tokens, len(tokens))
-            chunk_tokens = tokens[i:end_idx]
-            chunk_content = self.encoding.decode(chunk_tokens)
-            token_count = len(chunk_tokens)
+            end_idx = min(start_idx + self.max_tokens, total_tokens)
             
             # Skip chunks that are too small (except at the end)
-            if token_count < self.min_tokens and end_idx < len(tokens):
-                i += 1
+            if end_idx - start_idx < self.min_tokens and end_idx < total_tokens:
                 continue
             
+            windows.append(tokens[start_idx:end_idx])
+            at_end = end_idx == total_tokens
+            
+            # Decode a bounded batch at a time so chunks still stream
+            if at_end or len(windows) == _DECODE_BATCH_SIZE:
+                yield from self._chunks_from_windows(windows, position)
+                position += len(windows)
+                windows = []
+            
+            # Later windows would only repeat the tail of this one
+            if at_end:
+                break
+    
+    def _chunks_from_windows(
+        self,
+        windows: List[List[int]],
+        first_position: int
+    ) -> Generator[Chunk, None, None]:
+        """Build content chunks from consecutive token windows."""
+        # Decode the whole batch in one call on tiktoken's thread pool
+        chunk_contents = self.encoding.decode_batch(windows, num_threads=os.cpu_count() or 1)
+        
+        for position, (chunk_tokens, chunk_content) in enumerate(
+            zip(windows, chunk_contents), first_position
+        ):
             metadata = self.create_chunk_metadata(
                 chapter=None,
                 section=None,
@@ -394,23 +562,19 @@ class BookChunker:
                 id=self.generate_chunk_id(chunk_content, position),
                 content=chunk_content,
                 metadata=metadata,
-                token_count=token_count
+                token_count=len(chunk_tokens)
             )
             yield chunk
-            position += 1
-            
-            # Move to next chunk with overlap
-            i = max(i + 1, end_idx - self.overlap_tokens)
     
     def _create_chunk_from_buffer(
         self,
-        content_buffer: List[str],
+        content_buffer: List[Tuple[str, int]],
         metadata: Dict[str, Union[str, int, List[str]]],
         token_count: int,
         position: int
     ) -> Chunk:
         """Create a chunk from content buffer."""
-        content = '\n\n'.join(content_buffer)
+        content = '\n\n'.join(text for text, _ in content_buffer)
         chapter = metadata.get('chapter')
         
         return Chunk(
@@ -420,20 +584,27 @@ class BookChunker:
             token_count=token_count
         )
     
-    def _create_overlap_content(self, content_buffer: List[str]) -> List[str]:
-        """Create overlap content from the end of current buffer."""
-        overlap_content = []
+    def _create_overlap_content(
+        self,
+        content_buffer: List[Tuple[str, int]]
+    ) -> Tuple[List[Tuple[str, int]], int]:
+        """
+        Create overlap content from the end of current buffer.
+        
+        Returns:
+            Tuple of (overlap entries in buffer order, their total tokens)
+        """
+        overlap_start = len(content_buffer)
         overlap_tokens = 0
         
         # Work backwards to include as much content as possible within overlap limit
-        for content in reversed(content_buffer):
-            content_tokens = self.count_tokens(content)
+        for content, content_tokens in reversed(content_buffer):
             if overlap_tokens + content_tokens > self.overlap_tokens:
                 break
-            overlap_content.insert(0, content)
+            overlap_start -= 1
             overlap_tokens += content_tokens
         
-        return overlap_content
+        return content_buffer[overlap_start:], overlap_tokens
     
     def chunk_file(
         self,
@@ -489,16 +660,34 @@ class BookChunker:
         if not chunks:
             return ChunkingStats(0, 0, 0.0, 0, 0, 0, 0)
         
-        token_counts = [chunk.token_count for chunk in chunks]
-        chapters = set(chunk.metadata.get('chapter') for chunk in chunks if chunk.metadata.get('chapter'))
-        sections = set(chunk.metadata.get('section') for chunk in chunks if chunk.metadata.get('section'))
+        # Single pass, one metadata lookup per key
+        total_tokens = 0
+        min_tokens = chunks[0].token_count
+        max_tokens = min_tokens
+        chapters = set()
+        sections = set()
+        for chunk in chunks:
+            token_count = chunk.token_count
+            total_tokens += token_count
+            if token_count < min_tokens:
+                min_tokens = token_count
+            elif token_count > max_tokens:
+                max_tokens = token_count
+            
+            metadata = chunk.metadata
+            chapter = metadata.get('chapter')
+            if chapter:
+                chapters.add(chapter)
+            section = metadata.get('section')
+            if section:
+                sections.add(section)
         
         return ChunkingStats(
             total_chunks=len(chunks),
-            total_tokens=sum(token_counts),
-            avg_tokens_per_chunk=sum(token_counts) / len(token_counts),
-            min_tokens=min(token_counts),
-            max_tokens=max(token_counts),
+            total_tokens=total_tokens,
+            avg_tokens_per_chunk=total_tokens / len(chunks),
+            min_tokens=min_tokens,
+            max_tokens=max_tokens,
             chapters_found=len(chapters),
             sections_found=len(sections)
         )
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""
+Tests for the tiered conversation memory service.
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from linguistics.memory import MemoryService
+
+
+class TestMemoryService:
+    """Test suite for MemoryService."""
+    
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Path for a temporary SQLite cold tier."""
+        return str(tmp_path / "memory.sqlite3")
+    
+    @pytest.mark.asyncio
+    async def test_in_memory_history_and_context(self):
+        """Test basic storage without persistence."""
+        memory = MemoryService()
+        
+        await memory.add_conversation_message("c1", {"role": "user", "content": "Hello"})
+        await memory.add_conversation_message("c1", {"role": "assistant", "content": "Hi there"})
+        await memory.store_conversation_context("c1", {"topic": "greeting"})
+        
+        history = await memory.get_conversation_history("c1")
+        assert [m["content"] for m in history] == ["Hello", "Hi there"]
+        assert await memory.get_conversation_context("c1") == {"topic": "greeting"}
+        assert await memory.get_conversation_history("missing") == []
+        assert await memory.get_conversation_context("missing") == {}
+    
+    @pytest.mark.asyncio
+    async def test_hot_tier_is_bounded_and_evicted_sessions_reload(self, db_path):
+        """Test that evicted conversations are flushed to disk and reloaded."""
+        memory = MemoryService(storage_path=db_path, hot_sessions=2)
+        
+        for cid in ("a", "b", "c"):
+            await memory.add_conversation_message(cid, {"role": "user", "content": f"message {cid}"})
+            await memory.store_conversation_context(cid, {"id": cid})
+        
+        assert list(memory.conversations) == ["b", "c"]
+        
+        # Cold read does not promote the conversation
+        history = await memory.get_conversation_history("a")
+        assert history == [{"role": "user", "content": "message a"}]
+        assert "a" not in memory.conversations
+        
+        # Writes promote it back and keep the original ordering
+        await memory.add_conversation_message("a", {"role": "user", "content": "again"})
+        assert list(memory.conversations) == ["c", "a"]
+        history = await memory.get_conversation_history("a")
+        assert [m["content"] for m in history] == ["message a", "again"]
+        assert await memory.get_conversation_context("a") == {"id": "a"}
+        
+        await memory.close()
+    
+    @pytest.mark.asyncio
+    async def test_history_survives_restart(self, db_path):
+        """Test that conversations persist across service instances."""
+        memory = MemoryService(storage_path=db_path)
+        for i in range(5):
+            await memory.add_conversation_message("c1", {"role": "user", "content": f"turn {i}"})
+        await memory.store_conversation_context("c1", {"mood": "calm"})
+        await memory.close()
+        
+        restarted = MemoryService(storage_path=db_path)
+        history = await restarted.get_conversation_history("c1", limit=2)
+        assert [m["content"] for m in history] == ["turn 3", "turn 4"]
+        assert await restarted.get_conversation_context("c1") == {"mood": "calm"}
+        
+        results = await restarted.search_conversations("TURN 1")
+        assert len(results) == 1
+        assert results[0]["conversation_id"] == "c1"
+        await restarted.close()
+    
+    @pytest.mark.asyncio
+    async def test_search_ranks_by_occurrences_then_recency(self, db_path):
+        """Test that search returns the best matches across both tiers."""
+        memory = MemoryService(storage_path=db_path, hot_sessions=2)
+        await memory.add_conversation_message("old", {"role": "user", "content": "plan the plan plan"})
+        await memory.add_conversation_message("a", {"role": "user", "content": "a plan"})
+        await memory.add_conversation_message("a", {"role": "user", "content": "a newer plan"})
+        await memory.add_conversation_message("b", {"role": "user", "content": "plan b"})
+        await memory.add_conversation_message("b", {"role": "user", "content": "no match"})
+        
+        assert "old" not in memory.conversations
+        
+        results = await memory.search_conversations("PLAN", limit=3)
+        assert [(r["conversation_id"], r["message"]["content"]) for r in results] == [
+            ("old", "plan the plan plan"),
+            ("b", "plan b"),
+            ("a", "a newer plan"),
+        ]
+        assert await memory.search_conversations("plan", limit=0) == []
+        await memory.close()
+    
+    @pytest.mark.asyncio
+    async def test_clear_conversation_removes_persisted_data(self, db_path):
+        """Test that clearing a conversation also removes it from disk."""
+        memory = MemoryService(storage_path=db_path, hot_sessions=1)
+        await memory.add_conversation_message("c1", {"role": "user", "content": "secret"})
+        await memory.add_conversation_message("c2", {"role": "user", "content": "other"})
+        
+        await memory.clear_conversation("c1")
+        await memory.clear_conversation("c2")
+        
+        assert await memory.get_conversation_history("c1") == []
+        assert await memory.search_conversations("secret") == []
+        await memory.close()
+    
+    @pytest.mark.asyncio
+    async def test_background_flusher_writes_behind(self, db_path):
+        """Test that buffered writes reach disk without an explicit flush."""
+        memory = MemoryService(storage_path=db_path, flush_interval=0.01)
+        await memory.add_conversation_message("c1", {"role": "user", "content": "later", "n": {1: 2}})
+        await memory.store_conversation_context("c1", {"step": 1})
+        
+        for _ in range(100):
+            if not memory._pending_messages and not memory._dirty_contexts:
+                break
+            await asyncio.sleep(0.01)
+            
+        reader = sqlite3.connect(db_path)
+        try:
+            assert reader.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 1
+            assert reader.execute("SELECT COUNT(*) FROM contexts").fetchone()[0] == 1
+        finally:
+            reader.close()
+        await memory.close()
+        
+        restarted = MemoryService(storage_path=db_path)
+        history = await restarted.get_conversation_history("c1")
+        assert history == [{"role": "user", "content": "later", "n": {"1": 2}}]
+        await restarted.close()
+    
+    def test_flusher_runs_when_built_outside_the_loop(self, db_path):
+        """Test write-behind for a service built before asyncio.run drives it."""
+        memory = MemoryService(storage_path=db_path, flush_interval=0.01)
+        
+        def persisted_count() -> int:
+            reader = sqlite3.connect(db_path)
+            try:
+                return reader.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+            finally:
+                reader.close()
+        
+        async def add_and_wait(content: str) -> int:
+            await memory.add_conversation_message("c1", {"role": "user", "content": content})
+            for _ in range(100):
+                if not memory._pending_messages:
+                    break
+                await asyncio.sleep(0.01)
+            return persisted_count()
+        
+        # Each asyncio.run uses a fresh loop; both must flush before close()
+        assert asyncio.run(add_and_wait("first")) == 1
+        assert asyncio.run(add_and_wait("second")) == 2
+        
+        asyncio.run(memory.close())
+    
+    @pytest.mark.asyncio
+    async def test_non_string_content_is_persisted(self, db_path):
+        """Test that structured message content does not break flushing."""
+        memory = MemoryService(storage_path=db_path, hot_sessions=1)
+        parts = [{"type": "text", "text": "hello"}]
+        await memory.add_conversation_message("c1", {"role": "user", "content": parts})
+        await memory.add_conversation_message("c2", {"role": "user", "content": "hello"})
+        
+        assert "c1" not in memory.conversations
+        assert "c1" not in memory._next_seq
+        assert await memory.get_conversation_history("c1") == [{"role": "user", "content": parts}]
+        
+        await memory.add_conversation_message("c1", {"role": "user", "content": "again"})
+        history = await memory.get_conversation_history("c1")
+        assert [m["content"] for m in history] == [parts, "again"]
+        await memory.close()
+    
+    @pytest.mark.asyncio
+    async def test_unbindable_rows_are_dropped_not_retried(self, db_path):
+        """Test that a row SQLite cannot bind does not block later flushes."""
+        memory = MemoryService(storage_path=db_path)
+        await memory.add_conversation_message("c1", {"role": "user", "content": "kept"})
+        memory._pending_messages.append((("not", "bindable"), 0, None, None, b"{}"))
+        
+        await memory.flush()
+        assert memory._pending_messages == []
+        
+        await memory.add_conversation_message("c1", {"role": "user", "content": "also kept"})
+        await memory.close()
+        
+        restarted = MemoryService(storage_path=db_path)
+        history = await restarted.get_conversation_history("c1")
+        assert [m["content"] for m in history] == ["kept", "also kept"]
+        await restarted.close()
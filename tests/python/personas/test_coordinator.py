@@ -129,6 +129,53 @@ class TestLinguisticsCoordinator:
         # Should handle when scores are close
         assert coordinator.should_handle_intent("test input")
     
+    def test_should_handle_intent_compares_top_two_scores(self, coordinator):
+        """Test that only the gap between the two best scores matters."""
+        # Clear winner, listed after the runner-up
+        coordinator.analyze_user_intent = Mock(return_value={
+            "rapport": 0.3, "communication": 0.1, "emotions": 0.8
+        })
+        assert not coordinator.should_handle_intent("test input")
+        
+        # Tied leaders
+        coordinator.analyze_user_intent = Mock(return_value={
+            "rapport": 0.1, "communication": 0.6, "emotions": 0.6
+        })
+        assert coordinator.should_handle_intent("test input")
+        
+        # Ties for the best score keep the first persona
+        coordinator.analyze_user_intent = Mock(return_value={
+            "rapport": 0.1, "communication": 0.6, "emotions": 0.6
+        })
+        assert coordinator.select_best_expert("test input") == "communication"
+    
+    def test_route_turn_matches_separate_calls(self, coordinator):
+        """Test that route_turn agrees with the individual routing methods."""
+        for user_input in [
+            "I need help improving my communication skills",
+            "Help me brainstorm some creative ideas",
+            "Which expert should help me?",
+            "Hello",
+        ]:
+            result = coordinator.route_turn(user_input, {})
+            scores = coordinator.analyze_user_intent(user_input)
+            assert result["scores"] == scores
+            assert result["expert"] == coordinator.select_best_expert(user_input)
+            if max(scores.values()) >= coordinator.confidence_threshold:
+                assert result["confidence"] == max(scores.values())
+            else:
+                assert result["confidence"] == 0.0
+            assert result["should_handle"] == coordinator.should_handle_intent(user_input)
+    
+    def test_route_turn_fallback_confidence(self, coordinator):
+        """Test that a fallback route reports no confidence."""
+        coordinator.analyze_user_intent = Mock(return_value={
+            "rapport": 0.05, "communication": 0.0, "emotions": 0.02
+        })
+        result = coordinator.route_turn("test input")
+        assert result["expert"] == coordinator.fallback_expert
+        assert result["confidence"] == 0.0
+    
     def test_update_conversation_state(self, coordinator):
         """Test conversation state updates."""
         # Initial state
@@ -205,6 +252,17 @@ class TestLinguisticsCoordinator:
         boost = coordinator._calculate_context_boost("strategy", {}, "Random input")
         assert boost == 0
     
+    def test_context_boost_inflected_continuation(self, coordinator):
+        """Test that inflected continuation words keep the current expert."""
+        coordinator.current_expert = "communication"
+        
+        full = coordinator._calculate_context_boost("communication", {}, "Please continue")
+        for user_input in ["Continuing with that idea", "It continued badly", "Furthermore, what about tone?"]:
+            assert coordinator._calculate_context_boost("communication", {}, user_input) == full
+        
+        # Whole words only: "tomorrow" is not "more"
+        assert coordinator._calculate_context_boost("communication", {}, "See you tomorrow") < full
+    
     def test_expert_routing_coverage(self, coordinator):
         """Test that all expert personas can be routed to."""
         all_metadata = get_all_personas_metadata()
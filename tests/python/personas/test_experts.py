@@ -92,6 +92,18 @@ class TestExpertPersonas:
         processed = expert.preprocess_input("I'm extremely worried", {})
         assert "intensity" in processed
         assert "high" in processed
+        
+        # Intensity words match whole words only, as for the fears expert
+        processed = expert.preprocess_input("I feel angry about every meeting", {})
+        assert "intensity" not in processed
+        processed = expert.preprocess_input("I'm a little sad", {})
+        assert "intensity: low" in processed
+        
+        # Regulation needs match inflected forms as whole words
+        processed = expert.preprocess_input("I want help understanding my feelings", {})
+        assert "needs: understanding" in processed
+        processed = expert.preprocess_input("Anger management with my manager", {})
+        assert "needs: regulation" in processed
     
     def test_creativity_expert_initialization(self):
         """Test Creativity Expert initialization."""
@@ -112,6 +124,14 @@ class TestExpertPersonas:
         # Test constraint detection
         processed = expert.preprocess_input("I have limited time and money", {})
         assert "constraints" in processed
+        
+        # Constraint words match inflected forms as whole words
+        processed = expert.preprocess_input("I have tight constraints on this design", {})
+        assert "constraints: constraints" in processed
+        processed = expert.preprocess_input("We are limited by the deadlines", {})
+        assert "constraints: constraints, time" in processed
+        processed = expert.preprocess_input("Sometimes I draw", {})
+        assert "constraints" not in processed
     
     def test_strategy_expert_initialization(self):
         """Test Strategy Expert initialization."""
@@ -131,7 +151,17 @@ class TestExpertPersonas:
         
         # Test time horizon detection
         processed = expert.preprocess_input("What should I do this week?", {})
-        assert "time_horizon" in processed
+        assert "time_horizon: short_term" in processed
+        processed = expert.preprocess_input("Where do I want to be in five years?", {})
+        assert "time_horizon: long_term" in processed
+        processed = expert.preprocess_input("I don't know what to choose", {})
+        assert "time_horizon" not in processed
+        
+        # Stakeholder words match whole words only
+        processed = expert.preprocess_input("I need to plan my career path", {})
+        assert "stakeholders: personal" in processed
+        processed = expert.preprocess_input("Should I join the army?", {})
+        assert "stakeholders" not in processed
     
     def test_fears_expert_initialization(self):
         """Test Fears Expert initialization."""
@@ -149,6 +179,10 @@ class TestExpertPersonas:
         assert "fear_types" in processed
         assert "anxiety" in processed
         assert "social" in processed
+        
+        # Intensity words match whole words only
+        processed = expert.preprocess_input("I'm anxious about everything", {})
+        assert "intensity" not in processed
     
     def test_appearance_expert_initialization(self):
         """Test Appearance Expert initialization."""
@@ -251,6 +285,19 @@ class TestExpertPersonas:
             # This is a loose check - some experts might have broader expertise
             assert len(areas) >= 2, f"{expert.name} should have at least 2 expertise areas"
     
+    def test_all_experts_use_slots(self):
+        """Test that expert instances do not allocate a per-instance __dict__."""
+        experts = [
+            CommunicationExpert(), RapportExpert(), EmotionsExpert(),
+            CreativityExpert(), StrategyExpert(), FearsExpert(),
+            AppearanceExpert(), PracticeExpert(), IntegratorExpert()
+        ]
+        
+        for expert in experts:
+            assert not hasattr(expert, "__dict__"), f"{expert.name} should use __slots__"
+            with pytest.raises(AttributeError):
+                expert.arbitrary_attribute = True
+    
     def test_all_experts_system_prompts(self):
         """Test that all experts have substantial system prompts."""
         experts = [
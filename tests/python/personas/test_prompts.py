@@ -8,6 +8,7 @@ from linguistics.personas.prompts import (
     get_all_personas_metadata,
     get_persona_routing_keywords,
     get_persona_by_keyword,
+    PersonaMetadata,
     PERSONAS_METADATA
 )
 
@@ -30,6 +31,31 @@ class TestPersonaPrompts:
         
         for persona_id in required_personas:
             assert persona_id in all_metadata, f"Missing persona: {persona_id}"
+        
+        # The shared view cannot be modified by callers
+        assert all_metadata is get_all_personas_metadata()
+        with pytest.raises(TypeError):
+            all_metadata["custom"] = all_metadata["coordinator"]
+    
+    def test_routing_keywords_are_lowercased(self):
+        """Test that metadata stores routing keywords in lowercase."""
+        metadata = PersonaMetadata(
+            name="Custom",
+            description="Custom persona",
+            routing_keywords=["Custom", "SPECIALIZED"],
+            expertise_areas=["custom"],
+            system_prompt="You are a custom persona."
+        )
+        assert metadata.routing_keywords == ["custom", "specialized"]
+        assert metadata.localized_names == {}
+        
+        # Metadata is shared by every persona instance, so it is frozen
+        with pytest.raises(AttributeError):
+            metadata.name = "Renamed"
+        
+        for persona_id, metadata in PERSONAS_METADATA.items():
+            for keyword in metadata.routing_keywords:
+                assert persona_id in get_persona_by_keyword(keyword.upper())
     
     def test_persona_metadata_structure(self):
         """Test that each persona has the required metadata structure."""
@@ -87,6 +113,15 @@ class TestPersonaPrompts:
         unique_keywords = set(all_keywords)
         assert len(unique_keywords) >= 30, "Should have at least 30 unique routing keywords"
     
+    def test_routing_keywords_view_is_shared_and_read_only(self):
+        """Test that routing keywords are returned as a shared read-only view."""
+        routing_keywords = get_persona_routing_keywords()
+        assert routing_keywords is get_persona_routing_keywords()
+        assert routing_keywords["fears"] is PERSONAS_METADATA["fears"].routing_keywords
+        
+        with pytest.raises(TypeError):
+            routing_keywords["custom"] = ["custom"]
+    
     def test_get_persona_by_keyword(self):
         """Test keyword-based persona lookup."""
         # Test communication-related keywords
@@ -0,0 +1,184 @@
+"""
+Tests for the shared keyword-bucket routing helpers.
+"""
+
+from linguistics.personas import AppearanceExpert, CommunicationExpert
+from linguistics.personas import _routing
+from linguistics.personas._routing import (
+    BucketClassifier,
+    InputFeatures,
+    KeywordIndex,
+    classify,
+    classify_words,
+    contains_any,
+    count_matches,
+    first_match,
+    first_word_match,
+    get_input_features,
+    make_buckets,
+    make_word_buckets
+)
+
+
+class FakeAutomaton:
+    """Minimal stand-in for pyahocorasick's Automaton (substring search)."""
+    
+    def __init__(self):
+        self.words = {}
+        self.built = False
+    
+    def add_word(self, key, value):
+        self.words[key] = value
+    
+    def make_automaton(self):
+        self.built = True
+    
+    def iter(self, text):
+        assert self.built
+        for key, value in self.words.items():
+            start = text.find(key)
+            while start != -1:
+                yield start + len(key) - 1, value
+                start = text.find(key, start + 1)
+
+
+class TestRouting:
+    """Test suite for keyword-bucket routing helpers."""
+    
+    def test_make_buckets_preserves_order_and_lowercases(self):
+        """Test that buckets are frozen in mapping order with lowercased keywords."""
+        buckets = make_buckets({"b": ["Two", "three"], "a": ["One"]})
+        
+        assert buckets == (("b", ("two", "three")), ("a", ("one",)))
+    
+    def test_classify_matches_substrings_in_bucket_order(self):
+        """Test that classify keeps substring semantics and bucket order."""
+        buckets = make_buckets({
+            "clothing": ["outfit", "dress"],
+            "grooming": ["hair"],
+            "body_language": ["posture"]
+        })
+        
+        assert classify("fix my posture and my outfits", buckets) == ["clothing", "body_language"]
+        assert classify("nothing relevant", buckets) == []
+    
+    def test_contains_any_and_count_matches(self):
+        """Test keyword presence and counting helpers."""
+        keywords = ("thing", "stuff", "sort of")
+        
+        assert contains_any("some stuff", keywords)
+        assert not contains_any("nothing here", ("stuff",))
+        assert count_matches("something, stuff, sort of", keywords) == 3
+    
+    def test_first_match_returns_first_rule_in_order(self):
+        """Test that rules are checked in order and fall back to the default."""
+        rules = ((("panic", "anxiety"), "breathe"), (("fear",), "expose"))
+        
+        assert first_match("fear and panic", rules, "default") == "breathe"
+        assert first_match("fearful", rules, "default") == "expose"
+        assert first_match("calm", rules, "default") == "default"
+    
+    def test_input_features_are_computed_once_per_context(self):
+        """Test that features are stored in the context and reused."""
+        context = {}
+        features = get_input_features("Don't Panic, OK", context)
+        
+        assert features == InputFeatures(
+            text="Don't Panic, OK",
+            lower="don't panic, ok",
+            tokens=frozenset({"don", "t", "panic", "ok"}),
+            length=15
+        )
+        assert context["features"] is features
+        assert get_input_features("Don't Panic, OK", context) is features
+        
+        # A different input replaces the cached features
+        other = get_input_features("Something else", context)
+        assert other.text == "Something else"
+        assert context["features"] is other
+    
+    def test_personas_share_features_across_pre_and_postprocessing(self):
+        """Test that one request lowercases the input once for all personas."""
+        user_input = "How to communicate better about my outfit?"
+        context = {"original_input": user_input}
+        
+        CommunicationExpert().preprocess_input(user_input, context)
+        features = context["features"]
+        
+        AppearanceExpert().preprocess_input(user_input, context)
+        CommunicationExpert().postprocess_response("Response", context)
+        assert context["features"] is features
+    
+    def test_keyword_index_counts_keywords_per_group(self):
+        """Test that the index matches the per-group substring counts."""
+        groups = {
+            "rapport": ["connect", "trust", "bond"],
+            "integrator": ["connect", "synthesize"],
+            "fears": ["fear"]
+        }
+        index = KeywordIndex(groups)
+        text = "how do i connect and build trust without fear of fearing"
+        
+        assert index.find(text) == {"connect", "trust", "fear"}
+        assert index.count(text) == {
+            group: sum(1 for keyword in keywords if keyword in text)
+            for group, keywords in groups.items()
+        }
+        assert index.count("nothing relevant") == {}
+    
+    def test_bucket_classifier_matches_classify_per_set(self):
+        """Test that one classifier call equals classify() on each bucket set."""
+        emotions = make_buckets({"anger": ["angry", "mad"], "fear": ["afraid", "worried"]})
+        intensity = make_buckets({"high": ["very"], "low": ["a bit"]})
+        classifier = BucketClassifier(emotions, intensity)
+        text = "i am very angry and a bit worried"
+        
+        assert classifier.classify(text) == (["anger", "fear"], ["high", "low"])
+        assert classifier.classify(text) == (classify(text, emotions), classify(text, intensity))
+        assert classifier.classify("calm") == ([], [])
+    
+    def test_classify_words_matches_whole_words_and_phrases(self):
+        """Test that single words match tokens while phrases match substrings."""
+        buckets = make_word_buckets({
+            "time": ["time", "deadline"],
+            "understanding": ["understand", "figure out"]
+        })
+        
+        assert buckets[1] == ("understanding", frozenset({"understand"}), ("figure out",))
+        assert classify_words(InputFeatures.from_text("Sometimes I can't figure it out"), buckets) == []
+        assert classify_words(InputFeatures.from_text("No time to FIGURE OUT the deadline"), buckets) == [
+            "time",
+            "understanding"
+        ]
+    
+    def test_first_word_match_returns_first_bucket_in_order(self):
+        """Test that the first matching word bucket wins regardless of position."""
+        buckets = make_word_buckets({"high": ["very"], "low": ["a little"]})
+        
+        assert first_word_match(InputFeatures.from_text("A little, very"), buckets, "moderate") == "high"
+        assert first_word_match(InputFeatures.from_text("a little scared"), buckets, "moderate") == "low"
+        assert first_word_match(InputFeatures.from_text("every time"), buckets, "moderate") == "moderate"
+    
+    def test_automaton_path_matches_fallback(self, monkeypatch):
+        """Test that the pyahocorasick path gives the same results as the fallback."""
+        groups = {"rapport": ["connect", "trust"], "fears": ["fear", ""]}
+        emotions = make_buckets({"anger": ["angry", "mad"], "fear": ["afraid", "worried"]})
+        intensity = make_buckets({"high": ["very"], "low": ["a bit"]})
+        text = "i am very angry and a bit worried i cannot connect for fear"
+        
+        fallback_index = KeywordIndex(groups)
+        fallback_classifier = BucketClassifier(emotions, intensity)
+        
+        fake_module = type("FakeAhocorasick", (), {"Automaton": FakeAutomaton})
+        monkeypatch.setattr(_routing, "ahocorasick", fake_module, raising=False)
+        monkeypatch.setattr(_routing, "_ahocorasick_available", True)
+        
+        index = KeywordIndex(groups)
+        classifier = BucketClassifier(emotions, intensity)
+        assert isinstance(index._automaton, FakeAutomaton)
+        assert classifier._index is not None
+        
+        assert index.find(text) == fallback_index.find(text)
+        assert index.count(text) == fallback_index.count(text)
+        assert classifier.classify(text) == fallback_classifier.classify(text)
+        assert classifier.classify("calm") == ([], [])
@@ -5,9 +5,12 @@ Includes unit tests for chunking logic, metadata generation,
 and integration tests with ChromaDB.
 """
 
+import hashlib
+import math
 import tempfile
 from pathlib import Path
 from typing import Generator
+from unittest.mock import patch
 
 import pytest
 
@@ -63,6 +66,11 @@ class TestBookChunker:
         assert chunker.overlap_tokens == 30
         assert chunker.encoding is not None
     
+    def test_chunker_rejects_max_below_min(self):
+        """Test that max_tokens smaller than min_tokens is rejected."""
+        with pytest.raises(ValueError):
+            BookChunker(max_tokens=20, min_tokens=30, overlap_tokens=5)
+    
     def test_count_tokens(self):
         """Test token counting functionality."""
         text = "This is a test sentence for token counting."
@@ -70,6 +78,23 @@ class TestBookChunker:
         assert tokens > 0
         assert isinstance(tokens, int)
     
+    def test_count_tokens_is_cached(self):
+        """Test that repeated texts are only encoded once."""
+        short_text = "Short paragraph."
+        long_text = "Длинный абзац для проверки кэша. " * 50
+        expected = [self.chunker.count_tokens(short_text), self.chunker.count_tokens(long_text)]
+        
+        with patch.object(self.chunker.encoding, "encode", wraps=self.chunker.encoding.encode) as encode:
+            assert [self.chunker.count_tokens(short_text), self.chunker.count_tokens(long_text)] == expected
+            assert encode.call_count == 0
+    
+    def test_count_tokens_batch(self):
+        """Test that batch counting matches counting one text at a time."""
+        texts = ["First paragraph.", "Второй абзац с текстом.", "First paragraph.", "Длинный абзац. " * 40]
+        counts = self.chunker.count_tokens_batch(texts)
+        
+        assert counts == [BookChunker().count_tokens(text) for text in texts]
+    
     def test_generate_chunk_id(self):
         """Test deterministic chunk ID generation."""
         content = "Test content"
@@ -87,6 +112,14 @@ class TestBookChunker:
         # IDs should start with "chunk_"
         assert id1.startswith("chunk_")
     
+    def test_generate_chunk_id_is_stable(self):
+        """Test that chunk IDs keep their format, as they are used as upsert keys."""
+        expected_hash = hashlib.sha256("Текст главы_3_Глава 1".encode('utf-8')).hexdigest()[:12]
+        assert self.chunker.generate_chunk_id("Текст главы", 3, "Глава 1") == f"chunk_{expected_hash}_3"
+        
+        expected_hash = hashlib.sha256("Текст главы_3".encode('utf-8')).hexdigest()[:12]
+        assert self.chunker.generate_chunk_id("Текст главы", 3) == f"chunk_{expected_hash}_3"
+    
     def test_parse_markdown_structure(self):
         """Test markdown structure parsing."""
         structure = self.chunker.parse_markdown_structure(self.sample_text)
@@ -160,6 +193,18 @@ class TestBookChunker:
                 assert chunk.token_count >= self.chunker.min_tokens or \
                        chunk == chunks[-1]  # Last chunk can be smaller
     
+    def test_chunk_content_by_tokens_stops_at_end(self):
+        """Test that token windows advance by max_tokens - overlap_tokens and stop at the end."""
+        text = "Это предложение для проверки окон токенов. " * 60
+        total_tokens = self.chunker.count_tokens(text)
+        stride = self.chunker.max_tokens - self.chunker.overlap_tokens
+        
+        chunks = list(self.chunker.chunk_content(text, respect_structure=False))
+        
+        assert len(chunks) == math.ceil((total_tokens - self.chunker.overlap_tokens) / stride)
+        assert [chunk.metadata["position"] for chunk in chunks] == list(range(len(chunks)))
+        assert all(chunk.token_count == self.chunker.max_tokens for chunk in chunks[:-1])
+    
     def test_chunk_batch(self):
         """Test batch chunking with statistics."""
         chunks, stats = self.chunker.chunk_batch(self.sample_text)
@@ -206,6 +251,26 @@ class TestBookChunker:
         assert stats.chapters_found == 0
         assert stats.sections_found == 0
     
+    def test_calculate_stats(self):
+        """Test statistics calculation over chunks with and without chapters."""
+        chunks = [
+            Chunk(id="a", content="A", metadata={"chapter": "Глава 1", "section": "Раздел 1"}, token_count=30),
+            Chunk(id="b", content="B", metadata={"chapter": "Глава 1"}, token_count=10),
+            Chunk(id="c", content="C", metadata={"chapter": "Глава 2", "section": "Раздел 2"}, token_count=50),
+            Chunk(id="d", content="D", metadata={}, token_count=30),
+        ]
+        stats = self.chunker.calculate_stats(chunks)
+        
+        assert stats == ChunkingStats(
+            total_chunks=4,
+            total_tokens=120,
+            avg_tokens_per_chunk=30.0,
+            min_tokens=10,
+            max_tokens=50,
+            chapters_found=2,
+            sections_found=2
+        )
+    
     def test_chunk_validation(self):
         """Test Chunk validation."""
         # Valid chunk